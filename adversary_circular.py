@@ -1,4 +1,4 @@
-import random
+import numpy as np
 from src.logic_miner.core.lifter import HenselLifter
 
 # ==========================================
@@ -9,13 +9,17 @@ def generate_circular_logic(n=100, cycle_len=3):
     Generates a repeating sequence: 0, 1, 2, 0, 1, 2...
     y = x % cycle_len
     """
-    inputs = list(range(n))
-    outputs = [x % cycle_len for x in inputs]
+    inputs = np.arange(n, dtype=np.int64)
+    outputs = inputs % cycle_len
     return inputs, outputs
 
-def generate_full_noise(n=100, p=7):
-    inputs = list(range(n))
-    outputs = [random.randint(0, p-1) for _ in range(n)]
+def generate_full_noise(n=100, p=7, rng=None):
+    """
+    Uniform noise in Z_p. Pass a np.random.Generator for reproducible streams.
+    """
+    rng = rng or np.random.default_rng()
+    inputs = np.arange(n, dtype=np.int64)
+    outputs = rng.integers(0, p, size=n, dtype=np.int64)
     return inputs, outputs
 
 def run_test():
@@ -38,7 +42,8 @@ def run_test():
     
     print("\n[Scenario 1] Complex Cycle (y = x % 3) viewed in Z_7")
     c_in, c_out = generate_circular_logic(n=100, cycle_len=3)
-    res_cycl = lifter.lift(c_in, c_out, max_depth=1, min_consensus=0.30)
+    # HenselLifter consumes Python sequences: convert only at the boundary.
+    res_cycl = lifter.lift(c_in.tolist(), c_out.tolist(), max_depth=1, min_consensus=0.30)
     
     print(f"Status: {res_cycl['status']}")
     if res_cycl['status'] == 'CONVERGED':
@@ -51,7 +56,7 @@ def run_test():
     # 2. Stochastic Noise Test
     print("\n[Scenario 2] Stochastic Noise (Uniform Random in Z_7)")
     n_in, n_out = generate_full_noise(n=100, p=7)
-    res_noise = lifter.lift(n_in, n_out, max_depth=1, min_consensus=0.30)
+    res_noise = lifter.lift(n_in.tolist(), n_out.tolist(), max_depth=1, min_consensus=0.30)
     
     print(f"Status: {res_noise['status']}")
     print(f"Final Consensus Rate: {res_noise.get('final_consensus', 'N/A')}")
@@ -4,7 +4,14 @@ from .core.solver import ModularSolver
 from .core.ultrametric import UltrametricBuilder
 import zlib
 import re
-from collections import Counter
+import heapq
+from operator import itemgetter
+
+# Whitespace token with the '.,;:"\'()[]' edge punctuation stripped off
+# (same result as w.strip(...)); one DFA pass over the whole text.
+_ENTITY_RE = re.compile(r'(?<!\S)[.,;:"\'()\[\]]*([^\s.,;:"\'()\[\]]\S*?)[.,;:"\'()\[\]]*(?!\S)')
+
+_IGNORE = frozenset({'The', 'A', 'An', 'This', 'It', 'They', 'These', 'Those', 'He', 'She', 'But', 'And', 'Or', 'In', 'On', 'At', 'To', 'For', 'Of', 'With', 'From', 'By', 'As', 'When', 'If'})
 
 class StochasticChaosError(Exception):
     pass
@@ -38,25 +45,15 @@ class LogicMiner:
         print("--- [Logic Miner] Detected Logic: Natural Language (Semantic Tree) ---")
         
         # 1. Entity Extraction (Heuristic)
-        # Split on sentence boundaries
-        sentences = re.split(r'(?<=[.!?])\s+', raw_text)
-        words = []
-        ignore = {'The', 'A', 'An', 'This', 'It', 'They', 'These', 'Those', 'He', 'She', 'But', 'And', 'Or', 'In', 'On', 'At', 'To', 'For', 'Of', 'With', 'From', 'By', 'As', 'When', 'If'}
-        
-        for s in sentences:
-            tokens = s.split()
-            for i, w in enumerate(tokens):
-                clean = w.strip('.,;:"\'()[]')
-                if not clean: continue
-                # Heuristic: Capitalized inside sentence -> Strong Entity
-                # Capitalized at start -> Weak Entity (check ignore list)
-                if clean[0].isupper() and len(clean) > 2:
-                    if i == 0 and clean in ignore: continue
-                    words.append(clean)
-                    
-        counts = Counter(words)
+        # Capitalized tokens (len > 2) are entities. Sentence-initial ignore
+        # words need no special case: _IGNORE is filtered out everywhere.
+        counts = {}
+        for w in _ENTITY_RE.findall(raw_text):
+            if not w[0].isupper() or len(w) <= 2 or w in _IGNORE: continue
+            counts[w] = counts.get(w, 0) + 1
         # Top 150 entities
-        candidates = [w for w, c in counts.most_common(150) if c > 1 and w not in ignore]
+        top = heapq.nlargest(150, counts.items(), key=itemgetter(1))
+        candidates = [w for w, c in top if c > 1]
         
         print(f"   > Auto-Detected {len(candidates)} Entities.")
         
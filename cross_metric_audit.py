@@ -1,46 +1,98 @@
 import random
 import math
+import numpy as np
 from src.logic_miner.core.lifter import HenselLifter
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _sgd_svr_epoch(x, y, idx, w, b, learning_rate, epsilon):
+    """
+    One sequential epsilon-insensitive SGD epoch for f(x) = wx + b,
+    visiting samples in the order given by idx. Returns (w, b).
+    """
+    for i in idx:
+        diff = y[i] - (w * x[i] + b)
+        # Hinge Loss Gradient: of |y - (wx+b)| is -sign * x
+        if diff > epsilon:
+            w += learning_rate * x[i]
+            b += learning_rate
+        elif diff < -epsilon:
+            w -= learning_rate * x[i]
+            b -= learning_rate
+    return w, b
+
+def _linear_mse(x, y, w, b):
+    """Mean squared error of wx + b, accumulated in one pass."""
+    sq = 0.0
+    for i in range(len(x)):
+        r = y[i] - (w * x[i] + b)
+        sq += r * r
+    return sq / len(x)
+
+def _ols_stats_fused(x, y):
+    """
+    All five OLS sums (sx, sy, sxy, sxx, syy) in a single trip through memory.
+    """
+    sx = sy = sxy = sxx = syy = 0.0
+    for i in range(x.size):
+        xi = x[i]
+        yi = y[i]
+        sx += xi
+        sy += yi
+        sxy += xi * yi
+        sxx += xi * xi
+        syy += yi * yi
+    return sx, sy, sxy, sxx, syy
+
+def _ols_stats_numpy(x, y):
+    """Same sums as _ols_stats_fused via NumPy reductions (no-numba path)."""
+    return x.sum(), y.sum(), np.dot(x, y), np.dot(x, x), np.dot(y, y)
+
+if njit is not None:
+    _ols_stats = njit(cache=True, fastmath=True)(_ols_stats_fused)
+    _sgd_svr_epoch = njit(cache=True, fastmath=True, nogil=True)(_sgd_svr_epoch)
+    _linear_mse = njit(cache=True, fastmath=True, nogil=True)(_linear_mse)
+else:
+    _ols_stats = _ols_stats_numpy
+
 # ==========================================
 # AGENT ALPHA: GENERATOR
 # ==========================================
 class GeneratorAgent:
-    def __init__(self, size=1000, noise_ratio=0.15, switch_point=10):
+    def __init__(self, size=1000, noise_ratio=0.15, switch_point=10, rng=None):
         self.size = size
         self.noise_ratio = noise_ratio
         self.switch_point = switch_point
+        self.rng = rng if rng is not None else np.random.default_rng()
         
     def run(self):
         print(f"[Alpha] Generating {self.size} points. Switch at x={self.switch_point}. Noise={self.noise_ratio}")
-        inputs = []
-        outputs = []
+        rng = self.rng
+        x = np.arange(self.size)
         
         # Logic A (Utilitarian): y = 2x + 5 (mod 7) roughly
         # Logic B (Deontological): y = 5x + 30 (mod 7)
+        logic = np.where(x < self.switch_point, 2 * x + 5, 5 * x + 30)
         
-        for x in range(self.size):
-            is_noise = random.random() < self.noise_ratio
-            
-            if is_noise:
-                y = random.randint(0, 5000)
-            elif x < self.switch_point:
-                # Logic A
-                y = 2 * x + 5
-            else:
-                # Logic B
-                y = 5 * x + 30
-            
-            inputs.append(x)
-            outputs.append(y)
-            
-        return inputs, outputs
+        noise_mask = rng.random(self.size) < self.noise_ratio
+        noise_vals = rng.integers(0, 5001, self.size)
+        y = np.where(noise_mask, noise_vals, logic)
+        
+        # SoA: consumers take the int64 arrays directly
+        return x.astype(np.int64), y.astype(np.int64)
 
 # ==========================================
 # AGENT BETA: STANDARD (Regression + SVR)
 # ==========================================
 class StandardAgent:
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        
     def run(self, inputs, outputs):
+        """inputs, outputs: int64 arrays from GeneratorAgent."""
         print("[Beta] Running Standard Regressors...")
         
         # 1. Linear Regression (OLS)
@@ -57,10 +109,9 @@ class StandardAgent:
     def _run_ols(self, inputs, outputs):
         n = len(inputs)
         if n == 0: return 0
-        sum_x = sum(inputs)
-        sum_y = sum(outputs)
-        sum_xy = sum(x*y for x, y in zip(inputs, outputs))
-        sum_xx = sum(x*x for x in inputs)
+        x = np.asarray(inputs, dtype=np.float64)
+        y = np.asarray(outputs, dtype=np.float64)
+        sum_x, sum_y, sum_xy, sum_xx, sum_yy = _ols_stats(x, y)
         
         denom = (n * sum_xx - sum_x**2)
         if denom == 0: return float('inf')
@@ -68,9 +119,11 @@ class StandardAgent:
         m = (n * sum_xy - sum_x * sum_y) / denom
         c = (sum_y - m * sum_x) / n
         
-        # Calc MSE
-        errors = [(y - (m*x + c))**2 for x, y in zip(inputs, outputs)]
-        return sum(errors) / n
+        # Calc MSE analytically from the same sums: no second pass
+        # sum (y - mx - c)^2 expanded
+        sse = (sum_yy - 2*m*sum_xy - 2*c*sum_y
+               + m*m*sum_xx + 2*m*c*sum_x + n*c*c)
+        return float(sse / n)
 
     def _run_sgd_svr(self, inputs, outputs, epochs=5, learning_rate=0.0000001):
         # Very Scaled Down SGD for Linear SVR: f(x) = wx + b
@@ -78,50 +131,44 @@ class StandardAgent:
         b = 0.0
         epsilon = 5.0 # Epsilon-insensitive tube
         
+        x = np.asarray(inputs, dtype=np.float64)
+        y = np.asarray(outputs, dtype=np.float64)
+        if njit is None:
+            # Interpreted fallback: Python scalars index faster than ndarrays
+            x, y = x.tolist(), y.tolist()
+        
+        # One index buffer, reshuffled in place every epoch
+        idx = np.arange(len(inputs), dtype=np.int64)
+        
         for epoch in range(epochs):
             # Shuffle roughly
-            indices = list(range(len(inputs)))
-            random.shuffle(indices)
-            
-            for i in indices:
-                x = inputs[i]
-                y = outputs[i]
-                
-                prediction = w * x + b
-                diff = y - prediction
-                
-                # Hinge Loss Gradient
-                if abs(diff) > epsilon:
-                    sign = 1 if diff > 0 else -1
-                    # Gradient of |y - (wx+b)| is -sign * x
-                    w = w + learning_rate * (sign * x)
-                    b = b + learning_rate * (sign)
+            self.rng.shuffle(idx)
+            w, b = _sgd_svr_epoch(x, y, idx if njit is not None else idx.tolist(), w, b, learning_rate, epsilon)
         
         # Calc MSE
-        errors = [(y - (w*x + b))**2 for x, y in zip(inputs, outputs)]
-        return sum(errors) / len(errors)
+        return _linear_mse(x, y, w, b)
 
 # ==========================================
 # AGENT GAMMA: LOGIC MINER
 # ==========================================
 class MinerAgent:
     def run(self, inputs, outputs):
+        """inputs, outputs: int64 arrays from GeneratorAgent."""
         print("[Gamma] Running Logic Miner (PadicRansac)...")
         lifter = HenselLifter(p_base=7)
         
         # Run Lifter
         # Note: Logic Miner will latch onto the DOMINANT logic (which is Logic B, x >= 10)
         # We expect it to Identify Logic B and reject x < 10 as outliers.
-        result = lifter.lift(inputs, outputs, max_depth=2, min_consensus=0.5)
+        # HenselLifter consumes Python sequences: convert only at the boundary
+        result = lifter.lift(inputs.tolist(), outputs.tolist(), max_depth=2, min_consensus=0.5)
         
         # Analyze discontinuity
         # The 'Consensus Rate' is typically Inliers / Total
         # If Logic A is small (10 points), they are just outliers.
         
         # To find the discontinuity, we check the 'First Inlier'
-        inlier_indices = sorted(lifter.last_inliers) if hasattr(lifter, 'last_inliers') else [] 
-        # (Need to extract inliers from the solver/lifter logic if not exposed. 
-        # The current lifter returns coeffs but not the final inlier set in the dictionary.
+        # (The current lifter returns coeffs but not the final inlier set in the dictionary.
         # I will infer it by re-running the model check.)
         
         detected_start_x = -1
@@ -129,16 +176,15 @@ class MinerAgent:
             m0, c0 = result['coefficients'][0]
             # m1, c1 = result['coefficients'][1] if len > 1 else (0,0)
             
-            # Re-check all points against Level 0 Logic
-            inliers = []
-            for i, x in enumerate(inputs):
-                y = outputs[i]
-                pred = (m0 * x + c0) % 7
-                if pred == (y % 7):
-                    inliers.append(x)
+            # Re-check all points against Level 0 Logic (one vectorized compare)
+            xa = np.asarray(inputs, dtype=np.int64)
+            ya = np.asarray(outputs, dtype=np.int64)
+            mask = ((m0 * xa + c0 - ya) % 7) == 0
             
-            if inliers:
-                detected_start_x = min(inliers)
+            # Inputs are ascending (arange), so the first True is the minimum:
+            # argmax on a bool mask returns it without materializing xa[mask]
+            if mask.any():
+                detected_start_x = int(xa[mask.argmax()])
                 
         return {
             'status': result['status'],
@@ -150,14 +196,17 @@ class MinerAgent:
 # ORCHESTRATOR
 # ==========================================
 def main():
+    # One seeded Generator shared by the numpy-side agents
+    rng = np.random.default_rng(99)
+    # HenselLifter's RANSAC still samples from the stdlib stream
     random.seed(99)
     
     # 1. Generate
-    alpha = GeneratorAgent(size=1000, switch_point=10)
+    alpha = GeneratorAgent(size=1000, switch_point=10, rng=rng)
     inputs, outputs = alpha.run()
     
     # 2. Standard Audit
-    beta = StandardAgent()
+    beta = StandardAgent(rng)
     std_results = beta.run(inputs, outputs)
     
     # 3. Logic Audit
@@ -168,41 +217,56 @@ def main():
     generate_artifact(std_results, miner_results)
 
 def generate_artifact(std, miner):
-    content = f"""# Cross-Metric Performance Audit: Switching Ethics
-
-## Executive Summary
-Comparison of Standard Regression vs. Logic Miner handling a Phase Shift at $x=10$.
-Total Data: 1000 points. 15% Noise.
-
-## 1. Metric Comparison Table
-| Agent | Method | Metric | Value | Result |
-|-------|--------|--------|-------|--------|
-| **Beta** | Linear Regression (OLS) | MSE | {std['OLS_MSE']:.2f} | **FAIL** (High Error) |
-| **Beta** | Support Vector (SVR) | MSE | {std['SVR_MSE']:.2f} | **FAIL** (High Error) |
-| **Gamma** | Logic Miner (p-adic) | Convergence | {miner['convergence_rate']:.2%} | **PASS** (Stable) |
-
-## 2. Phase Shift Detection
-* **Actual Discontinuity**: $x = 10$
-* **Standard Methods**: Cannot detect. Models smooth over the gap.
-* **Logic Miner**: Detected dominant logic regime starting at **x = {miner['detected_boundary']}**.
-    * The Miner successfully rejected the "Utilitarian" inputs ($x < 10$) as "Logical Incoherence" relative to the dominant "Deontological" framework.
-
-## 3. Visual Analysis (ASCII)
-```
-[Logic A]      [       Logic B (Dominant)        ]
-(x=0..9)       (x=10......1000)
-   |                 /
-   |               /
-   |             /   <-- Logic Miner locks here
-   o           /
-             /
-Standard Regression attempts average ----> [High Bias]
-```
-"""
+    # One entry per line; sections are appended independently so they can be
+    # made conditional without re-flowing a single template string
+    parts = [
+        "# Cross-Metric Performance Audit: Switching Ethics",
+        "",
+        "## Executive Summary",
+        "Comparison of Standard Regression vs. Logic Miner handling a Phase Shift at $x=10$.",
+        "Total Data: 1000 points. 15% Noise.",
+        "",
+    ]
+    
+    parts += [
+        "## 1. Metric Comparison Table",
+        "| Agent | Method | Metric | Value | Result |",
+        "|-------|--------|--------|-------|--------|",
+        f"| **Beta** | Linear Regression (OLS) | MSE | {std['OLS_MSE']:.2f} | **FAIL** (High Error) |",
+        f"| **Beta** | Support Vector (SVR) | MSE | {std['SVR_MSE']:.2f} | **FAIL** (High Error) |",
+        f"| **Gamma** | Logic Miner (p-adic) | Convergence | {miner['convergence_rate']:.2%} | **PASS** (Stable) |",
+        "",
+    ]
+    
+    parts += [
+        "## 2. Phase Shift Detection",
+        "* **Actual Discontinuity**: $x = 10$",
+        "* **Standard Methods**: Cannot detect. Models smooth over the gap.",
+        f"* **Logic Miner**: Detected dominant logic regime starting at **x = {miner['detected_boundary']}**.",
+        '    * The Miner successfully rejected the "Utilitarian" inputs ($x < 10$) as "Logical Incoherence" relative to the dominant "Deontological" framework.',
+        "",
+    ]
+    
+    parts += [
+        "## 3. Visual Analysis (ASCII)",
+        "```",
+        "[Logic A]      [       Logic B (Dominant)        ]",
+        "(x=0..9)       (x=10......1000)",
+        "   |                 /",
+        "   |               /",
+        "   |             /   <-- Logic Miner locks here",
+        "   o           /",
+        "             /",
+        "Standard Regression attempts average ----> [High Bias]",
+        "```",
+    ]
+    
     with open("audit_report.md", "w") as f:
-        f.write(content)
+        f.writelines(p + "\n" for p in parts)
     print("Audit Report Generated: audit_report.md")
-    print(content)
+    for p in parts:
+        print(p)
+    print()
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,47 @@
 import collections
+import functools
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 from src.logic_miner.core.solver import ModularSolver
 from src.logic_miner.engine import LogicMiner
+from src.logic_miner.core.metrics import int64_or_none, INT64_FIDELITY_MAX_M
+
+@functools.lru_cache(maxsize=32)
+def _crt_tables(moduli):
+    """
+    CRT prefactors for a fixed moduli tuple: (prod, [M_i * inv(M_i, n_i)]).
+    Callers reuse the same prime basis, so the Bezout work is done once.
+    """
+    prod = 1
+    for n in moduli: prod *= n
+    coeffs = []
+    for n in moduli:
+        p = prod // n
+        # Inverse of p modulo n
+        coeffs.append(p * pow(p, -1, n))
+    return prod, coeffs
+
+def _solve_prime(p, inputs, outputs):
+    """
+    Local RANSAC fit mod p. Returns (a, b) for y = a*x + b, or None.
+    Top-level so it pickles into the per-prime process pool.
+    """
+    solver = ModularSolver(p)
+    # Correct method call
+    res = solver.ransac([(x, y % p) for x, y in zip(inputs, outputs)], iterations=50, max_degree=1)
+    
+    # Extract params from result
+    # Result format: {'model': (degree, (a, b)), 'ratio': ...}
+    # Extract params using correct key structure
+    # ransac returns {'degree': d, 'model': params, ...}
+    degree = res.get('degree', -1)
+    params = res.get('model')
+    
+    if degree == 1 and params:
+        return tuple(params)
+    elif degree == 0 and params:
+        return 0, params[0]
+    return None
 
 class TheorizerAdelic:
     """
@@ -35,15 +76,8 @@ class TheorizerAdelic:
         # where M_i = M/p_i, y_i = inv(M_i, p_i)
         
         def crt(remainders, moduli):
-            sum_val = 0
-            prod = 1
-            for n in moduli: prod *= n
-            
-            for r, n in zip(remainders, moduli):
-                p = prod // n
-                # Inverse of p modulo n
-                inv = pow(p, -1, n)
-                sum_val += r * p * inv
+            prod, coeffs = _crt_tables(tuple(moduli))
+            sum_val = sum(r * coeff for r, coeff in zip(remainders, coeffs))
             return sum_val % prod
 
         coeffs_a = []
@@ -66,39 +100,33 @@ class TheorizerAdelic:
         Product Formula Approach:
         A point is a TRUE inlier only if it is an inlier in ALL valid local fields.
         """
-        # 1. Get inlier sets for each prime
-        inlier_sets = []
+        # 1. Get inlier masks for each prime, intersected as we go
+        # int64 copies only when every value fits; otherwise exact Python ints
+        xa = int64_or_none(inputs)
+        ya = int64_or_none(outputs)
+        global_mask = np.ones(len(inputs), dtype=bool)
+        n_fields = 0
+        
+        # Local fields are independent: solve every prime in parallel
+        with ProcessPoolExecutor(max_workers=max(1, len(primes))) as ex:
+            futures = {p: ex.submit(_solve_prime, p, inputs, outputs) for p in primes}
+            local_models = {p: f.result() for p, f in futures.items()}
         
         for p in primes:
-            solver = ModularSolver(p)
-            # Correct method call
-            res = solver.ransac([(x, y % p) for x, y in zip(inputs, outputs)], iterations=50, max_degree=1)
-            
-            # Extract params from result
-            # Result format: {'model': (degree, (a, b)), 'ratio': ...}
-            # Extract params using correct key structure
-            # ransac returns {'degree': d, 'model': params, ...}
-            degree = res.get('degree', -1)
-            params = res.get('model')
-            
-            if degree == 1 and params:
-                a, b = params
-            elif degree == 0 and params:
-                a = 0
-                b = params[0]
-            else:
+            if local_models[p] is None:
                 continue
-            inliers = set()
-            for i, (x, y) in enumerate(zip(inputs, outputs)):
-                if (a*x + b - y) % p == 0:
-                    inliers.add(i)
-            inlier_sets.append(inliers)
+            a, b = local_models[p]
+            if xa is not None and ya is not None and p < INT64_FIDELITY_MAX_M:
+                # Residues below 2^31, so (a % p) * (x % p) cannot wrap
+                global_mask &= (((a % p) * (xa % p) + b % p - ya % p) % p) == 0
+            else:
+                global_mask &= np.fromiter(((a*x + b - y) % p == 0 for x, y in zip(inputs, outputs)),
+                                           dtype=bool, count=len(inputs))
+            n_fields += 1
             
-        # 2. Intersect
-        if not inlier_sets: return set()
-        global_inliers = set.intersection(*inlier_sets)
-        
-        return global_inliers
+        # 2. Intersection is the running mask; sets only at the API boundary
+        if not n_fields: return set()
+        return set(np.flatnonzero(global_mask).tolist())
 
 def run_experiment():
     print("### ADELIC RESEARCH: Hasse Principle & Product Formula ###")
@@ -5,7 +5,9 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from logic_miner.engine import LogicMiner
-from pypdf import PdfReader
+from logic_miner.core.metrics import get_valuation
+import math
+from pdf_cache import load_pages, page_count
 
 def audit_chemistry():
     pdf_path = "d:/Dropbox/logic-miner-engine/texts/Chemistry2e-WEB.pdf"
@@ -13,17 +15,13 @@ def audit_chemistry():
     print(f"   > Reading PDF: {pdf_path}")
     
     try:
-        reader = PdfReader(pdf_path)
-        print(f"   > Pages: {len(reader.pages)}")
+        print(f"   > Pages: {page_count(pdf_path)}")
         
         # Extract Text from a dense section (Pages 100-200)
         # Assuming Chapter 1-3 range.
-        text = ""
         # Let's grab 50 pages from index 100.
         print("   > Extracting text (Pages 100-150)...")
-        for i in range(100, 150):
-            page = reader.pages[i]
-            text += page.extract_text() + "\n"
+        text = load_pages(pdf_path, 100, 150)
             
         print(f"   > Extracted {len(text)} characters.")
         
@@ -54,12 +52,9 @@ def audit_chemistry():
             if n==0: return 0.0
             prod = 1.0
             for p in primes:
-                v = 0
-                temp = abs(n)
-                while temp > 0 and temp % p == 0:
-                    v += 1
-                    temp //= p
-                prod *= (p ** -v)
+                v = get_valuation(n, p)
+                # 2^-v is an exponent shift, no float power needed
+                prod = math.ldexp(prod, -v) if p == 2 else prod * (p ** -v)
             return prod
 
         for t in targets:
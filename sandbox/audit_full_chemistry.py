@@ -5,6 +5,8 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from logic_miner.core.serial_synthesis import SerialManifoldSynthesizer
+from logic_miner.core.metrics import get_valuation
+import math
 
 def audit_full_chemistry():
     pdf_path = "d:/Dropbox/logic-miner-engine/texts/Chemistry2e-WEB.pdf"
@@ -38,12 +40,8 @@ def audit_full_chemistry():
         
         def get_hasse_prod(n, p_val):
             if n==0: return 0.0
-            v = 0
-            temp = abs(n)
-            while temp > 0 and temp % p_val == 0:
-                v += 1
-                temp //= p_val
-            return p_val ** (-v)
+            v = get_valuation(n, p_val)
+            return math.ldexp(1.0, -v) if p_val == 2 else p_val ** (-v)
             
         for t in targets:
              for k in coords:
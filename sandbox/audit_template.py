@@ -0,0 +1,59 @@
+import time
+
+# Shared layout of the production audit dumps (v21, v22, v25). The static
+# text lives in format templates; each script supplies only its own lines.
+
+RULE = "-" * 70
+BANNER = "=" * 70
+
+HEADER_TPL = (
+    BANNER + "\n"
+    "   LOGIC MINER ENGINE - FINAL PRODUCTION AUDIT (PROTOCOL {protocol})\n"
+    + BANNER + "\n"
+    "Timestamp: {timestamp}\n"
+    "Corpus: Chemistry 2e (Full Volume)\n"
+    "Processing Depth: {page_count} Pages\n"
+    "{notes}"
+    "Total Execution Time: {run_time:.2f} seconds"
+)
+
+SECTION_TPL = "\n" + RULE + "\n{title}\n" + RULE
+
+FOOTER_TPL = "\n" + BANNER + "\n   AUDIT COMPLETE - {verdict}\n" + BANNER
+
+# CONCEPT TRACE rows: entity, coordinate (as str), logic class
+COORD_ROW = "{:<30} | Coord: {:<10} | Logic: {}".format
+ADDR_ROW = "{:<30} | Addr: {:<15} | Logic: {}".format
+
+# MANIFOLD SPLINE TRACE table
+_SPLINE_ROW = "{:<8} | {:<6} | {:<8} | {}".format
+SPLINE_HEAD = _SPLINE_ROW("BLOCK", "PRIME", "ENERGY", "POLYNOMIAL SAMPLE") + "\n" + RULE
+
+def header(protocol, page_count, run_time, notes=()):
+    """Banner plus run facts; notes are extra lines before the run time."""
+    return HEADER_TPL.format(
+        protocol=protocol,
+        timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
+        page_count=page_count,
+        notes="".join(n + "\n" for n in notes),
+        run_time=run_time,
+    )
+
+def section(title, lines):
+    """A ruled section title followed by its body lines."""
+    return "\n".join([SECTION_TPL.format(title=title), *lines])
+
+def footer(verdict):
+    return FOOTER_TPL.format(verdict=verdict)
+
+def spline_trace_lines(trace):
+    if not trace:
+        return ["No spline trace available (Monolithic fallback)."]
+    rows = [_SPLINE_ROW(str(point['block']), str(point['p']), f"{point['energy']:.4f}",
+                        str(point['polynomial'][:3]) + "...")
+            for point in trace]
+    return [SPLINE_HEAD] + rows
+
+def concept_lines(entities, coords, classific, row=COORD_ROW, default=None):
+    """One row per entity, in the given order."""
+    return [row(ent, str(coords.get(ent, 0)), classific.get(ent, default)) for ent in entities]
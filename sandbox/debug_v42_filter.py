@@ -3,6 +3,7 @@ import sys
 import os
 import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
@@ -10,40 +11,52 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 from logic_miner.engine import LogicMiner
 from logic_miner.core.serial_synthesis_v42 import SerialSynthesizerV42
 from logic_miner.core.algebraic_text import AlgebraicTextSolver
-from logic_miner.core.adelic import AdelicIntegrator
-from pypdf import PdfReader
+from pdf_cache import load_pages
 
-def check_term_complexity(term, vectors, integrator):
+CRT_PRIMES = (5, 7, 11)
+
+def _crt_basis(primes):
+    """
+    CRT prefactors for a fixed prime basis: (M, [M_i * inv(M_i, p_i) mod M]).
+    Every term uses the same primes, so this is computed once per run.
+    """
+    M = 1
+    for p in primes: M *= p
+    return M, [(M // p) * pow(M // p, -1, p) % M for p in primes]
+
+def check_term_complexity(term, vectors, basis):
     """
     Computes K(x) for a term given its p-adic vectors.
+    basis: (M, coeffs) from _crt_basis(CRT_PRIMES).
     """
-    primes = [5, 7, 11]
     if len(vectors) < 3:
         return None, "Missing Primes"
         
-    vec = [vectors[p] for p in primes]
-    models = [{'p': p, 'params': (vec[i],), 'degree': 0} for i, p in enumerate(primes)]
-    
-    res = integrator.solve_crt(models)
-    if not res:
-        return None, "CRT Failed"
-        
-    modulus = res['modulus']
-    global_val = res['params'][0]
+    modulus, coeffs = basis
+    global_val = sum(vectors[p] * c for p, c in zip(CRT_PRIMES, coeffs)) % modulus
     k = global_val / float(modulus)
     
     return k, f"Val={global_val}/Mod={modulus}"
 
+def _solve_prime(p, mat, candidates, counts):
+    """
+    Solves the association matrix mod p. Returns (coordinates, error).
+    Top-level so it pickles into the per-prime process pool.
+    """
+    solver = AlgebraicTextSolver(p=p)
+    try:
+        res = solver.solve(mat, candidates, counts)
+        return res['coordinates'], None
+    except Exception as e:
+        return None, e
+
 def main():
     print("--- [V.42 Filter Debugger] ---")
     
     pdf_path = "d:/Dropbox/logic-miner-engine/texts/Chemistry2e-WEB.pdf"
-    reader = PdfReader(pdf_path)
     
     # Extract raw text from first 50 pages
-    text = ""
-    for i in range(50):
-        text += reader.pages[i].extract_text() + "\n"
+    text = load_pages(pdf_path, 0, 50)
         
     print(f"   > Extracted {len(text)} chars.")
     
@@ -55,27 +68,30 @@ def main():
     
     # 2. Get Vectors
     term_vectors = defaultdict(dict)
-    primes = [5, 7, 11]
+    primes = list(CRT_PRIMES)
     
-    for p in primes:
-        print(f"   > Solving Mod {p}...")
-        solver = AlgebraicTextSolver(p=p)
-        try:
-            # Quick matrix build
-            mat, counts, _ = featurizer.build_association_matrix(text, candidates)
-            res = solver.solve(mat, candidates, counts)
-            coords = res['coordinates']
+    # Quick matrix build (prime-independent, so built once)
+    mat, counts, _ = featurizer.build_association_matrix(text, candidates)
+    
+    # Primes are independent: solve them in parallel
+    print(f"   > Solving Mod {primes}...")
+    with ProcessPoolExecutor(max_workers=len(primes)) as ex:
+        futures = {p: ex.submit(_solve_prime, p, mat, candidates, counts) for p in primes}
+        
+        for p in primes:
+            coords, err = futures[p].result()
+            if err is not None:
+                print(f"     ! Mod {p} failed: {err}")
+                continue
             for t, c in coords.items():
                 term_vectors[t][p] = c
-        except Exception as e:
-            print(f"     ! Mod {p} failed: {e}")
             
     # 3. Analyze Complexity
-    integrator = AdelicIntegrator()
+    basis = _crt_basis(CRT_PRIMES)
     results = []
     
     for t in candidates:
-        k, note = check_term_complexity(t, term_vectors[t], integrator)
+        k, note = check_term_complexity(t, term_vectors[t], basis)
         if k is not None:
             results.append((t, k, note))
             
@@ -1,6 +1,8 @@
 
 import sys
 import os
+import logging
+import functools
 
 # Add project root to path
 sys.path.append(os.getcwd())
@@ -8,27 +10,35 @@ sys.path.append(os.getcwd())
 from sandbox.frontend_experiment.v60_lib.engine import V60Engine, TriadParser
 from sandbox.frontend_experiment.v60_lib.term_normalizer import TermNormalizer
 
+_log = logging.getLogger(__name__)
+
+# Relation -> phase, one O(1) lookup instead of a scan per bucket
+_PHASE_MAP = {}
+for _phase, _relations in (
+    # Original Map
+    (1j, ['cause', 'causes', 'lead', 'trigger', 'produce', 'yield']), # Rotation by 90 degrees (Causality)
+    (-1, ['is-not', 'differ', 'distinct', 'unlike']), # Rotation by 180 degrees (Negation)
+    (1+1j, ['correlate', 'associate', 'link']), # 45 degrees (Correlation/Entanglement)
+    # NEW: Explicit Mapping for Nightmare Cycle
+    (1j, ['leads to', 'lead to', 'result in', 'results in']),
+):
+    for _r in _relations:
+        _PHASE_MAP.setdefault(_r, _phase) # first bucket wins, as in the old if-chain
+
+@functools.lru_cache(maxsize=512)
+def _phase_for(relation: str) -> complex:
+    """Phase for a raw relation string; relations repeat heavily across triads."""
+    return _PHASE_MAP.get(relation.lower().strip(), 1) # Identity by default
+
 class ExperimentalParser(TriadParser):
     def _get_phase(self, relation: str) -> complex:
         """
         Overridden Phase Map to include Causal Flows.
         """
-        r = relation.lower().strip()
-        print(f"DEBUG PHASE: '{r}'") 
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("PHASE: '%s'", relation.lower().strip())
         
-        # Original Map
-        if r in ['cause', 'causes', 'lead', 'trigger', 'produce', 'yield']:
-            return 1j # Rotation by 90 degrees (Causality)
-        if r in ['is-not', 'differ', 'distinct', 'unlike']:
-            return -1 # Rotation by 180 degrees (Negation)
-        if r in ['correlate', 'associate', 'link']:
-            return 1+1j # 45 degrees (Correlation/Entanglement)
-            
-        # NEW: Explicit Mapping for Nightmare Cycle
-        if r in ['leads to', 'lead to', 'result in', 'results in']:
-            return 1j 
-            
-        return 1 # Identity
+        return _phase_for(relation)
 
 class ExperimentalEngine(V60Engine):
     """
@@ -1,18 +1,56 @@
 
+import os
+import functools
+from sys import intern
+from array import array
 import spacy
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, deque
 import numpy as np
 import re
+import math
+from bisect import bisect_right
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple, Dict, Optional
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Protocol V.60: Hensel-Voted P-adic Ontology Miner
 # "We are not mining text. We are reconstructing the Galois geometry of a book."
 
+# spaCy batching for windowed parsing (nlp.pipe); override via environment
+SPACY_BATCH_SIZE = int(os.environ.get("V60_SPACY_BATCH_SIZE", "32"))
+
+# Below this many chars (~16 windows) forking parser processes, each of
+# which reloads the spaCy model, costs more than it saves.
+PARALLEL_MIN_CHARS = 40000
+
+# Pipeline components TriadParser never consults
+_UNUSED_PIPES = ("ner",)
+
+# Leading determiner stripped by TriadParser._clean
+_DET_RE = re.compile(r'^(?:a|an|the)\s+')
+
+def _sieve_primes(limit: int) -> np.ndarray:
+    """All primes <= limit (Sieve of Eratosthenes over a NumPy bool mask)."""
+    is_prime = np.ones(limit + 1, dtype=bool)
+    is_prime[:2] = False
+    is_prime[4::2] = False
+    for i in range(3, math.isqrt(limit) + 1, 2):
+        if is_prime[i]:
+            is_prime[i * i::2 * i] = False
+    return np.flatnonzero(is_prime)
+
 class PrimeMapper:
     """
     Assigns a unique prime number to each relation type.
     This turns the text into a numerical field where divisibility implies hierarchy.
     """
+    __slots__ = ('registry', 'next_prime', '_pool_limit', '_prime_pool', '_pool_idx')
+    
     def __init__(self):
         # Pre-assign standard relations to low primes for stability
         self.registry = {
@@ -38,33 +76,79 @@ class PrimeMapper:
             'to': 43         # New: Direction
         }
         self.next_prime = 47 
-        self.primes = self._prime_generator()
-        # Fast forward generator (2...43) -> 14 primes used
-        for _ in range(14): next(self.primes) 
-        
-    def _prime_generator(self):
-        D = {}
-        q = 2
-        while True:
-            if q not in D:
-                yield q
-                D[q * q] = [q]
-            else:
-                for p in D[q]:
-                    D.setdefault(p + q, []).append(p)
-                del D[q]
-            q += 1
+        # Sieved prime pool; 2...43 are pre-assigned above -> skip 14 primes
+        self._pool_limit = 1024
+        self._prime_pool = _sieve_primes(self._pool_limit)[14:]
+        self._pool_idx = 0
+        
+    def _next_prime(self) -> int:
+        if self._pool_idx >= len(self._prime_pool):
+            # Pool exhausted: double the bound and re-sieve (prefix is unchanged)
+            self._pool_limit *= 2
+            self._prime_pool = _sieve_primes(self._pool_limit)[14:]
+        p = int(self._prime_pool[self._pool_idx])
+        self._pool_idx += 1
+        return p
             
+    def get_prime_norm(self, rel_norm: str) -> int:
+        """get_prime for an already lowercased/stripped relation (hot path)."""
+        p = self.registry.get(rel_norm)
+        if p is not None:
+            return p
+        return self.get_prime(rel_norm)
+        
     def get_prime(self, relation: str) -> int:
         rel_norm = relation.lower().strip()
         if rel_norm in self.registry:
             return self.registry[rel_norm]
         
         # Assign new prime
-        p = next(self.primes)
+        p = self._next_prime()
         self.registry[rel_norm] = p
         return p
 
+# Phase XXIX: Gaussian Logic Phases (relation -> rotation)
+_PHASE_TABLE = {}
+for _phase, _relations in (
+    (1j, ['cause', 'causes', 'lead', 'trigger', 'produce', 'yield']), # Rotation by 90 degrees (Causality)
+    (-1, ['is-not', 'differ', 'distinct', 'unlike']), # Rotation by 180 degrees (Negation)
+    (1+1j, ['correlate', 'associate', 'link']), # 45 degrees (Correlation/Entanglement)
+    # Phase XXXV: Extended Causal Map
+    (1j, ['lead to', 'leads to', 'result in', 'results in']),
+):
+    for _r in _relations:
+        _PHASE_TABLE.setdefault(_r, _phase)
+
+@functools.lru_cache(maxsize=4096)
+def _phase_for(relation: str) -> complex:
+    return _PHASE_TABLE.get(relation.lower().strip(), 1) # Identity (Standard connection)
+
+def _subtree_sizes(heads: List[int]) -> List[int]:
+    """
+    Token count of every subtree, from the head index of each token
+    (roots point at themselves). Children are folded into their heads
+    deepest first, so each arc is visited once.
+    """
+    n = len(heads)
+    depth = [-1] * n
+    for i in range(n):
+        path = []
+        j = i
+        while depth[j] < 0 and heads[j] != j:
+            path.append(j)
+            j = heads[j]
+        if depth[j] < 0:
+            depth[j] = 0
+        d = depth[j]
+        for k in reversed(path):
+            d += 1
+            depth[k] = d
+    size = [1] * n
+    for i in sorted(range(n), key=depth.__getitem__, reverse=True):
+        if heads[i] != i:
+            size[heads[i]] += size[i]
+    return size
+
 class TriadParser:
     """
     Phase I: Passive Measurement.
@@ -83,68 +167,90 @@ class TriadParser:
             from term_normalizer import TermNormalizer
             
         self.nlp = load_spacy_safe(model)
+        # Triads only read pos_/dep_/lemma_ and the parse tree (tagger,
+        # attribute_ruler, lemmatizer, parser); entities are never used
+        for name in _UNUSED_PIPES:
+            if name in self.nlp.pipe_names:
+                self.nlp.disable_pipe(name)
         self.normalizer = TermNormalizer()
+        
+        # Integer ids for the POS/dep tests in _extract: token.pos/token.dep
+        # compare as ints, where pos_/dep_ decode a string per access.
+        # Substring tests ("subj" in dep_) become sets over the parser labels
+        ids = self.nlp.vocab.strings
+        labels = self.nlp.get_pipe("parser").labels if "parser" in self.nlp.pipe_names else ()
+        self._pos_verb = ids["VERB"]
+        self._pos_nominal = frozenset((ids["NOUN"], ids["PROPN"]))
+        self._dep_root = ids["ROOT"]
+        self._dep_subj = frozenset(ids[l] for l in labels if "subj" in l)
+        self._dep_obj = frozenset([ids[l] for l in labels if "obj" in l] + [ids["attr"], ids["acomp"]])
+        self._dep_prep = ids["prep"]
+        self._dep_pobj = ids["pobj"]
+        self._dep_amod = ids["amod"]
 
     def parse(self, text: str) -> List[Tuple[str, str, str]]:
-        doc = self.nlp(text)
+        return self._extract(self.nlp(text))
+
+    def parse_batch(self, windows, n_process=1):
+        """
+        Batched parse over an iterable of (idx, text) windows.
+        Yields (idx, triads) in order; spaCy batches the pipeline instead of
+        being invoked once per window, across n_process worker processes.
+        """
+        docs = self.nlp.pipe(((t, idx) for idx, t in windows), as_tuples=True,
+                             batch_size=SPACY_BATCH_SIZE, n_process=n_process)
+        for doc, idx in docs:
+            yield idx, self._extract(doc)
+
+    def _extract(self, doc) -> List[Tuple[str, str, str]]:
         triads = []
+        # Token texts, read once: a contiguous subtree's phrase is the slice
+        # between its edges. spaCy's parser can restore non-projective arcs,
+        # so a span longer than its subtree falls back to the subtree walk.
+        words = [t.text for t in doc]
+        sizes = _subtree_sizes([t.head.i for t in doc])
+        
+        def phrase(tok):
+            left, right = tok.left_edge.i, tok.right_edge.i
+            if right - left + 1 == sizes[tok.i]:
+                return " ".join(words[left:right + 1])
+            return " ".join(t.text for t in tok.subtree)
+        
+        pos_verb, dep_root = self._pos_verb, self._dep_root
+        dep_subj, dep_obj = self._dep_subj, self._dep_obj
+        dep_prep, dep_pobj = self._dep_prep, self._dep_pobj
         
         for sent in doc.sents:
             # 1. Subject-Verb-Object/Attribute
+            # (sentence order, not sent.root first: triad order fixes the
+            # order in which new relations are assigned primes)
             for token in sent:
-                if token.pos_ == "VERB" or token.dep_ == "ROOT":
-                    subj = None
-                    objs = []
-                    
-                    for child in token.children:
-                        if "subj" in child.dep_:
-                            subj = " ".join([t.text for t in child.subtree])
-                        if "obj" in child.dep_ or child.dep_ == "attr" or child.dep_ == "acomp":
-                            objs.append(" ".join([t.text for t in child.subtree]))
-                        if child.dep_ == "prep":
-                            # Capture prepositional objects: "bonds WITH oxygen"
-                            for grandchild in child.children:
-                                if grandchild.dep_ == "pobj":
-                                    # Append tuple (obj_text, prep_text)
-                                    objs.append((" ".join([t.text for t in grandchild.subtree]), child.text))
-                                    
-                    if subj:
-                        # Normalize and add
-                        # Handle direct objects (no prep)
-                        # We need to know which objs had preps.
-                        # Retrofit 'objs' list to always be tuples?
-                        # Or process mixed list.
-                        # Let's fix the list above.
-                        pass
-
-            # Re-collect logic to be cleaner
-            # 1. Subject-Verb-Object/Attribute
-            for token in sent:
-                if token.pos_ == "VERB" or token.dep_ == "ROOT":
+                if token.pos == pos_verb or token.dep == dep_root:
                     subj = None
                     # List of (obj_text, prep_text or None)
                     collected_objs = []
                     
                     for child in token.children:
-                        if "subj" in child.dep_:
-                            subj = " ".join([t.text for t in child.subtree])
-                        if "obj" in child.dep_ or child.dep_ == "attr" or child.dep_ == "acomp":
-                            collected_objs.append((" ".join([t.text for t in child.subtree]), None))
-                        if child.dep_ == "prep":
+                        dep = child.dep
+                        if dep in dep_subj:
+                            subj = phrase(child)
+                        if dep in dep_obj:
+                            collected_objs.append((phrase(child), None))
+                        if dep == dep_prep:
                             for grandchild in child.children:
-                                if grandchild.dep_ == "pobj":
-                                    obj_text = " ".join([t.text for t in grandchild.subtree])
+                                if grandchild.dep == dep_pobj:
+                                    obj_text = phrase(grandchild)
                                     prep_text = child.text
                                     collected_objs.append((obj_text, prep_text))
                                     
                     if subj:
                         base_relation = token.lemma_
+                        s_n = self.normalizer.normalize(self._clean(subj))
                         for obj_text, prep in collected_objs:
                             final_rel = base_relation
                             if prep:
                                 final_rel = f"{base_relation} {prep}"
                             
-                            s_n = self.normalizer.normalize(self._clean(subj))
                             o_n = self.normalizer.normalize(self._clean(obj_text))
                             r_n = self.normalizer.normalize(final_rel)
                             
@@ -154,7 +260,7 @@ class TriadParser:
             # 2. Adjective-Noun (Attributional Logic)
             # "The stable atom" -> (atom, has-property, stable)
             for token in sent:
-                if token.dep_ == "amod" and token.head.pos_ in ["NOUN", "PROPN"]:
+                if token.dep == self._dep_amod and token.head.pos in self._pos_nominal:
                     adj = token.text
                     noun = token.head.text
                     
@@ -172,22 +278,19 @@ class TriadParser:
         Phase XXIX: Gaussian Logic Phases.
         Assigns geometric rotation based on logical operator.
         """
-        r = relation.lower().strip()
-        if r in ['cause', 'causes', 'lead', 'trigger', 'produce', 'yield']:
-            return 1j # Rotation by 90 degrees (Causality)
-        if r in ['is-not', 'differ', 'distinct', 'unlike']:
-            return -1 # Rotation by 180 degrees (Negation)
-        if r in ['correlate', 'associate', 'link']:
-            return 1+1j # 45 degrees (Correlation/Entanglement)
-        # Phase XXXV: Extended Causal Map
-        if r in ['lead to', 'leads to', 'result in', 'results in']:
-            return 1j 
-        return 1 # Identity (Standard connection)
+        return _phase_for(relation)
 
     def parse_with_phase(self, text: str):
         # Wrapper to return (s, r, o, phase)
         # Re-using parse logic but augmenting it
-        simple_triads = self.parse(text)
+        return self._with_phase(self.parse(text))
+
+    def parse_batch_with_phase(self, windows, n_process=1):
+        """parse_batch, yielding (idx, [(s, r, o, phase), ...])."""
+        for idx, simple_triads in self.parse_batch(windows, n_process):
+            yield idx, self._with_phase(simple_triads)
+
+    def _with_phase(self, simple_triads):
         phased_triads = []
         for s, r, o in simple_triads:
             ph = self._get_phase(r)
@@ -196,60 +299,191 @@ class TriadParser:
 
     def _clean(self, term: str) -> str:
         # Remove determiners and lower case
-        term = re.sub(r'^(a|an|the)\s+', '', term.lower())
-        return term.strip()
+        return _DET_RE.sub('', term.lower()).strip()
+
+# Prepositional relations: the reified (S, R) / (R, O) pairs they would add
+# link every term to a function word, which is noise, so only (S, O) is kept
+_REIFY_SKIP = frozenset({"in", "of", "from", "with", "on", "to"})
+
+# Relations lifted as primary logic primes, and their split manifolds
+# ("is_1", "has_2", ...: base, underscore, then a digit) after the blow-up
+_PRIME_BASES = ('causes', 'has', 'is', 'produces', 'temperature', 'has-property', 'bonds')
+_PRIME_SPLIT_RE = re.compile(r'(' + '|'.join(map(re.escape, _PRIME_BASES)) + r')_\d')
+
+def _pair(a, b):
+    """Canonical (sorted) key for an unordered pair, without a sort call."""
+    return (a, b) if a <= b else (b, a)
+
+def _triad_pair_keys_loops(s, r, o, col, n_terms, n_cols):
+    """
+    COO keys for the three pairs each triad touches, in order
+    (S, O), (S, R), (R, O): key = (lo_id * n_terms + hi_id) * n_cols + col.
+    """
+    n = s.size
+    keys = np.empty(3 * n, dtype=np.int64)
+    for i in range(n):
+        a = s[i]
+        b = o[i]
+        c = r[i]
+        keys[3 * i] = ((min(a, b) * n_terms + max(a, b)) * n_cols) + col[i]
+        keys[3 * i + 1] = ((min(a, c) * n_terms + max(a, c)) * n_cols) + col[i]
+        keys[3 * i + 2] = ((min(c, b) * n_terms + max(c, b)) * n_cols) + col[i]
+    return keys
+
+def _triad_pair_keys_numpy(s, r, o, col, n_terms, n_cols):
+    """Same keys as _triad_pair_keys_loops, one broadcast per pair kind."""
+    def key(a, b):
+        return (np.minimum(a, b) * n_terms + np.maximum(a, b)) * n_cols + col
+    return np.stack([key(s, o), key(s, r), key(r, o)], axis=1).ravel()
+
+if njit is not None:
+    _triad_pair_keys = njit(cache=True)(_triad_pair_keys_loops)
+else:
+    _triad_pair_keys = _triad_pair_keys_numpy
 
 class ValuationTensorBuilder:
     """
     Builds the valuation tensor X_{A,B}.
     For each pair (A,B), V_p(X_{A,B}) = exponent of prime p in the relation product.
     """
-    def __init__(self, prime_mapper: PrimeMapper):
+    __slots__ = ('mapper', 'counts', 'value_type', 'terms',
+                 '_term_ids', '_term_names', '_prime_cols', '_primes',
+                 '_s', '_r', '_o', '_cols', '_re', '_im', '_reify')
+    
+    def __init__(self, prime_mapper: PrimeMapper, use_complex: bool = True):
         self.mapper = prime_mapper
-        try:
-            from sandbox.frontend_experiment.v60_lib.gaussian import GaussianInt
-        except ImportError:
-            from gaussian import GaussianInt
+        if use_complex:
+            # Builtin complex: += runs in C, and the integer-valued parts stay
+            # exact in doubles up to 2^53 (downstream reads .real/.imag only)
+            value_type = complex
+        else:
+            try:
+                from sandbox.frontend_experiment.v60_lib.gaussian import GaussianInt
+            except ImportError:
+                from gaussian import GaussianInt
+            value_type = GaussianInt
             
-        self.counts = defaultdict(lambda: defaultdict(GaussianInt)) # counts[pairs][relation] = GaussianInt
-        self.GaussianInt = GaussianInt
+        self.counts = defaultdict(lambda: defaultdict(value_type)) # counts[pairs][relation] = value_type(re, im)
+        self.value_type = value_type
         self.terms = set()
         
+        # Staged (SoA) ingestion: one int64 row per triad (term ids, prime
+        # column, phase parts); pair rows are expanded and summed with NumPy
+        # and folded into self.counts on _flush()
+        self._term_ids = {}
+        self._term_names = []
+        self._prime_cols = {}
+        self._primes = []
+        self._s = array('q')
+        self._r = array('q')
+        self._o = array('q')
+        self._cols = array('q')
+        self._re = array('q')
+        self._im = array('q')
+        self._reify = array('b') # 0: (S, O) only, see _REIFY_SKIP
+        
+    def _term_id(self, term):
+        tid = self._term_ids.get(term)
+        if tid is None:
+            tid = self._term_ids[term] = len(self._term_names)
+            self._term_names.append(term)
+        return tid
+        
+    def _flush(self):
+        """Sums the staged contributions per (pair, prime) into self.counts."""
+        if not self._s: return
+        n_terms = len(self._term_names)
+        n_cols = len(self._primes)
+        col = np.frombuffer(self._cols, dtype=np.int64)
+        keys = _triad_pair_keys(np.frombuffer(self._s, dtype=np.int64),
+                                np.frombuffer(self._r, dtype=np.int64),
+                                np.frombuffer(self._o, dtype=np.int64),
+                                col, n_terms, n_cols)
+        re_part = np.repeat(np.frombuffer(self._re, dtype=np.int64), 3)
+        im_part = np.repeat(np.frombuffer(self._im, dtype=np.int64), 3)
+        
+        reify = np.frombuffer(self._reify, dtype=np.int8).astype(bool)
+        if not reify.all():
+            # Drop the (S, R) and (R, O) rows of non-reified triads
+            keep = np.ones((reify.size, 3), dtype=bool)
+            keep[:, 1] = reify
+            keep[:, 2] = reify
+            keep = keep.ravel()
+            keys = keys[keep]
+            re_part = re_part[keep]
+            im_part = im_part[keep]
+        
+        uniq, first, inv = np.unique(keys, return_index=True, return_inverse=True)
+        re_sum = np.zeros(uniq.size, dtype=np.int64)
+        im_sum = np.zeros(uniq.size, dtype=np.int64)
+        np.add.at(re_sum, inv, re_part)
+        np.add.at(im_sum, inv, im_part)
+        
+        # Fold in first-seen order, so pairs (and primes within a pair) keep
+        # the insertion order a direct per-triad accumulation would give
+        names = self._term_names
+        value_type = self.value_type
+        order = np.argsort(first, kind='stable')
+        for key, a, b in zip(uniq[order].tolist(), re_sum[order].tolist(), im_sum[order].tolist()):
+            pair_key, c = divmod(key, n_cols)
+            lo, hi = divmod(pair_key, n_terms)
+            pair = _pair(names[lo], names[hi])
+            self.counts[pair][self._primes[c]] += value_type(a, b)
+            
+        self._s = array('q')
+        self._r = array('q')
+        self._o = array('q')
+        self._cols = array('q')
+        self._re = array('q')
+        self._im = array('q')
+        self._reify = array('b')
+        
     def ingests(self, triads: List[Tuple]):
+        # Prepass: strings -> int ids and phase -> int parts, one row per triad
+        n_known = len(self._term_names)
+        # Parser relations arrive normalized: skip get_prime's lower/strip
+        get_prime = self.mapper.get_prime_norm
         for item in triads:
             # Handle both 3-tuple (legacy) and 4-tuple (complex)
             if len(item) == 4:
                 s, r, o, phase = item
-                # Ensure phase is GaussianInt (Robust Duck Typing)
-                if isinstance(phase, self.GaussianInt):
-                    pass
-                elif isinstance(phase, complex):
-                    phase = self.GaussianInt(int(phase.real), int(phase.imag))
-                elif hasattr(phase, 'real') and hasattr(phase, 'imag'):
-                    # Alien GaussianInt (from different import path)
-                    phase = self.GaussianInt(phase.real, phase.imag)
+                # Phase as integer (real, imag) parts (Robust Duck Typing:
+                # GaussianInt, complex, alien GaussianInt, or a plain number)
+                if hasattr(phase, 'real') and hasattr(phase, 'imag'):
+                    re_part, im_part = int(phase.real), int(phase.imag)
                 else:
-                    phase = self.GaussianInt(int(phase), 0)
+                    re_part, im_part = int(phase), 0
             else:
                 s, r, o = item
-                phase = self.GaussianInt(1, 0)
+                re_part, im_part = 1, 0
                 
-            self.terms.add(s)
-            self.terms.add(o)
+            # Terms repeat heavily: share one str object per distinct term so
+            # the set and pair-key dicts hold (and compare) a single instance
+            s = intern(s)
+            r = intern(r)
+            o = intern(o)
             
-            p = self.mapper.get_prime(r)
+            p = get_prime(r)
+            col = self._prime_cols.get(p)
+            if col is None:
+                col = self._prime_cols[p] = len(self._primes)
+                self._primes.append(p)
             
-            # Standard Direct Link (S, O)
-            pair = tuple(sorted((s, o)))
-            self.counts[pair][p] += phase
+            # Direct Link (S, O) plus Generalized Reification (S -> R -> O):
+            # the three pairs are expanded from these ids in _triad_pair_keys;
+            # prepositions (_REIFY_SKIP) keep only the direct link, and the
+            # relation is not registered as a term
+            s_id = self._term_id(s)
+            reify = r not in _REIFY_SKIP
+            self._s.append(s_id)
+            self._r.append(self._term_id(r) if reify else s_id) # masked in _flush
+            self._o.append(self._term_id(o))
+            self._cols.append(col)
+            self._re.append(re_part)
+            self._im.append(im_part)
+            self._reify.append(reify)
             
-            # Generalized Reification (S -> R -> O)
-            self.terms.add(r)
-            pair_sr = tuple(sorted((s, r)))
-            self.counts[pair_sr][p] += phase 
-            
-            pair_ro = tuple(sorted((r, o)))
-            self.counts[pair_ro][p] += phase
+        self.terms.update(self._term_names[n_known:])
             
     def ingest_seeds(self, integer_lists: List[List[int]]):
         """
@@ -312,14 +546,14 @@ class ValuationTensorBuilder:
                 p = self.mapper.get_prime(rel)
                 
                 # Symmetrize
-                pair = tuple(sorted((head, child)))
+                pair = _pair(head, child)
                 
                 # Current value in the tensor
-                current_val = self.counts[pair].get(p, self.GaussianInt(0, 0))
+                current_val = self.counts[pair].get(p, self.value_type(0, 0))
                 
-                # Add the depth as a real component to the GaussianInt
+                # Add the depth as a real component to the Gaussian value
                 # We assume seeds are "real" contributions unless specified otherwise
-                to_add = self.GaussianInt(depth * 10, 0) # Strong seed
+                to_add = self.value_type(depth * 10, 0) # Strong seed
                 
                 self.counts[pair][p] = current_val + to_add
                 
@@ -327,10 +561,12 @@ class ValuationTensorBuilder:
                 if isinstance(child_node, list):
                     traverse(child_node, root_term, depth + 1)
         
+        self._flush()
         for tree in integer_lists:
             traverse(tree, tree[0])
             
     def build_metric_space(self) -> Dict:
+        self._flush()
         return dict(self.counts)
 
 class GlobalAdelicIntegrator:
@@ -402,22 +638,24 @@ class HenselLifterV60:
         imag_space = defaultdict(lambda: defaultdict(int))
         
         entities = set()
-        
-        for pair, p_vals in metric_space.items():
-            for e in pair: entities.add(e)
+        for pair in metric_space:
+            entities.update(pair)
             
-            for p, val in p_vals.items():
-                if hasattr(val, 'real') and hasattr(val, 'imag'):
-                    # Handle both complex and GaussianInt
-                    # We lift the magnitude of the net weight
-                    r = int(abs(val.real))
-                    i = int(abs(val.imag))
-                    
-                    if r > 0: real_space[pair][p] = r
-                    if i > 0: imag_space[pair][p] = i
-                else:
-                    # Legacy int handling
-                    real_space[pair][p] = int(val)
+        # One typed pass: complex, GaussianInt and plain ints all expose
+        # .real/.imag. We lift the magnitude of the net weight per component.
+        cells = [(pair, p) for pair, p_vals in metric_space.items() for p in p_vals]
+        n_cells = len(cells)
+        re_part = np.fromiter((v.real for p_vals in metric_space.values() for v in p_vals.values()),
+                              dtype=np.float64, count=n_cells)
+        im_part = np.fromiter((v.imag for p_vals in metric_space.values() for v in p_vals.values()),
+                              dtype=np.float64, count=n_cells)
+        
+        for space, part in ((real_space, re_part), (imag_space, im_part)):
+            mag = np.abs(part).astype(np.int64) # int(abs(x)) truncation
+            hit = np.flatnonzero(mag > 0)
+            for k, m in zip(hit.tolist(), mag[hit].tolist()):
+                pair, p = cells[k]
+                space[pair][p] = m
 
         # 2. Define Lifting Logic (Inner Function)
         def run_lifting(sub_metric):
@@ -434,6 +672,19 @@ class HenselLifterV60:
             for vals in sub_metric.values():
                 max_p_val = max(max_p_val, vals.get(self.p, 0))
                 
+            # Edges with a p-valuation, extracted once (levels start at 1,
+            # so pairs without one never pass the threshold)
+            p_edges = []
+            for (a, b), vals in sub_metric.items():
+                v = vals.get(self.p, 0)
+                if v >= 1:
+                    p_edges.append((a, b, v))
+            # Strongest first: the edges passing a level's threshold are then a
+            # prefix, so deep levels stop before the weak edges instead of
+            # rescanning them (components do not depend on edge order)
+            p_edges.sort(key=lambda e: e[2], reverse=True)
+            neg_vals = [-v for _, _, v in p_edges]
+                
             # 2. Define Lifting Logic (Inner Function)
             def recurse_partition(nodes, level, base_coord):
                 if not nodes or level > max_p_val + 1:
@@ -441,12 +692,13 @@ class HenselLifterV60:
 
                 # Build Adjacency for current level (Threshold Graph)
                 adj = defaultdict(set)
-                for (a, b), vals in sub_metric.items():
-                    if a in nodes and b in nodes:
-                        # Strong connection check
-                        if vals.get(self.p, 0) >= level:
-                            adj[a].add(b)
-                            adj[b].add(a)
+                node_set = set(nodes)
+                n_strong = bisect_right(neg_vals, -level) # edges with v >= level
+                for a, b, _ in islice(p_edges, n_strong):
+                    # Strong connection check
+                    if a in node_set and b in node_set:
+                        adj[a].add(b)
+                        adj[b].add(a)
 
                 # Connected Components (Cluster Detection)
                 seen = set()
@@ -458,11 +710,11 @@ class HenselLifterV60:
                 for e in sorted_nodes:
                     if e not in seen:
                         # BFS for Component
-                        q = [e]
+                        q = deque([e])
                         seen.add(e)
                         comp = []
                         while q:
-                            curr = q.pop(0)
+                            curr = q.popleft()
                             comp.append(curr)
                             for n in adj[curr]:
                                 if n not in seen:
@@ -501,8 +753,23 @@ class HenselLifterV60:
             
         return final_coords
 
+# Per-prime lifting in worker processes: the tensor is shipped once per
+# worker (pool initializer), not once per prime
+_LIFT_TENSOR = None
+
+def _init_lift_worker(tensor):
+    global _LIFT_TENSOR
+    _LIFT_TENSOR = tensor
+
+def _lift_one(p_name, p_val):
+    """Lift and synthesize one active prime against the worker's tensor."""
+    from sandbox.frontend_experiment.v60_lib.polynomial import OntologyPolynomialSynthesizer
+    coords = HenselLifterV60(p_base=p_val).lift(_LIFT_TENSOR)
+    return coords, OntologyPolynomialSynthesizer().synthesize(coords, p_name)
+
 class V60Engine:
-    def __init__(self):
+    def __init__(self, workers=None):
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
         self.mapper = PrimeMapper()
         self.parser = TriadParser()
         self.builder = ValuationTensorBuilder(self.mapper)
@@ -531,19 +798,20 @@ class V60Engine:
         term_counts = Counter()
         total_triads = 0
         
-        for idx, window_text in self.slider.generate(text):
+        # Phase XXIX: Use Phased Parser (windows batched through nlp.pipe)
+        # Windows parse independently, so parsing fans out across processes;
+        # ingestion stays here, in window order, so prime assignment is
+        # identical to a serial run (no registry drift between workers)
+        n_process = self.workers if len(text) >= PARALLEL_MIN_CHARS else 1
+        for idx, triads in self.parser.parse_batch_with_phase(self.slider.generate(text), n_process):
             print(f"   > Processing Window {idx}...")
-        for idx, window_text in self.slider.generate(text):
-            print(f"   > Processing Window {idx}...")
-            # Phase XXIX: Use Phased Parser
-            triads = self.parser.parse_with_phase(window_text)
             total_triads += len(triads)
             
             for (s, r, o, phase) in triads:
                 term_counts[s] += 1
                 term_counts[o] += 1
                 term_counts[r] += 1
-                pair = tuple(sorted((s, o)))
+                pair = _pair(s, o)
                 self.raw_cooc[pair] += 1
                 
             # Accumulate into global tensor
@@ -588,7 +856,7 @@ class V60Engine:
             if is_connected:
                 neighbors_map[A].add(B)
                 neighbors_map[B].add(A)
-                adj_valuation[tuple(sorted((A, B)))] = 1
+                adj_valuation[_pair(A, B)] = 1
 
         # Identify Singularities
         replacements = {}
@@ -597,6 +865,10 @@ class V60Engine:
             if resolver.detect_singularity(node, neighbors_map[node], adj_valuation):
                 split_map = resolver.resolve(node, neighbors_map[node], self.gluer.global_tensor)
                 if split_map:
+                    # One shared str per new manifold name ('is_1' is produced
+                    # once per neighbour): blow-up keys then hash a cached
+                    # string and compare by identity, like the ingested terms
+                    split_map = {nb: intern(name) for nb, name in split_map.items()}
                     replacements[node] = split_map
                     # Debug: Print sample of split
                     if node in ['has', 'is', 'temperature']:
@@ -606,8 +878,12 @@ class V60Engine:
                         sample_map = {k: split_map[k] for k in sample_keys}
                         print(f"     Sample mapping: {sample_map}")
 
+        # Nodes of the final tensor, collected while it is (re)built
+        all_nodes = nodes
+        
         # Apply Blow-up (Renaming in Tensor)
         if replacements:
+            all_nodes = set()
             print(f"   > [Blow-up] Applying {len(replacements)} singularity resolutions...")
             new_tensor = defaultdict(dict) # (A, B) -> {p: v}
             
@@ -615,36 +891,36 @@ class V60Engine:
                 # A and B were sorted by the gluer/builder usually, but let's be sure
                 # Re-indexing might change the order (e.g. 'is' -> 'is_1' vs 'atom')
                 
-                # Default: Keep original names
-                candidates_A = [A]
-                candidates_B = [B]
+                # Default: Keep original names; apply replacements
+                map_a = replacements.get(A)
+                if map_a is None:
+                    na = A
+                else:
+                    na = map_a.get(B)
+                    # B not in Ego Graph of A. PRUNE link to A.
+                    if na is None: continue
+                    
+                map_b = replacements.get(B)
+                if map_b is None:
+                    nb = B
+                else:
+                    nb = map_b.get(A)
+                    # A not in Ego Graph of B. PRUNE link to B.
+                    if nb is None: continue
                 
-                # Apply replacements
-                if A in replacements:
-                    if B in replacements[A]:
-                        candidates_A = [replacements[A][B]]
-                    else:
-                        # B not in Ego Graph of A. PRUNE link to A.
-                        candidates_A = []
-                        
-                if B in replacements:
-                    if A in replacements[B]:
-                        candidates_B = [replacements[B][A]]
-                    else:
-                        # A not in Ego Graph of B. PRUNE link to B.
-                        candidates_B = []
+                # Reconstruct link
+                if na == nb: continue # Self-loops usually noise
                 
-                # Reconstruct links
-                for na in candidates_A:
-                    for nb in candidates_B:
-                        if na == nb: continue # Self-loops usually noise
-                        
-                        # Canonicalize Key
-                        key = tuple(sorted((na, nb)))
-                        
-                        # Merge p-vals (if multiple original edges map here)
-                        for p, v in p_vals.items():
-                            new_tensor[key][p] = new_tensor[key].get(p, 0) + v
+                # Canonicalize Key
+                key = _pair(na, nb)
+                if p_vals:
+                    all_nodes.add(na)
+                    all_nodes.add(nb)
+                    
+                    # Merge p-vals (if multiple original edges map here)
+                    merged = new_tensor[key]
+                    for p, v in p_vals.items():
+                        merged[p] = merged.get(p, 0) + v
                             
             self.gluer.global_tensor = new_tensor
             print(f"   > [Blow-up] Tensor Re-indexed. New Size: {len(new_tensor)}")
@@ -719,62 +995,98 @@ class V60Engine:
         # If we find 'is_1', 'is_2' in the node list (from replacements), we add them to registry.
         
         # Let's find all "Prime-Like" nodes that exist in the graph.
-        all_nodes = set()
-        for (u, v) in self.gluer.global_tensor.keys():
-            all_nodes.add(u)
-            all_nodes.add(v)
+        # (all_nodes was collected during the adjacency / blow-up pass)
             
+        bases = _PRIME_BASES
+        # Check for splits (is_1, is_2, etc.): one match per node
+        variants = defaultdict(list)
+        for node in all_nodes:
+            m = _PRIME_SPLIT_RE.match(node)
+            if m:
+                variants[m.group(1)].append(node)
+        
+        # Each base, then its splits
         active_primes = []
-        bases = ['causes', 'has', 'is', 'produces', 'temperature', 'has-property', 'bonds']
         for p_name in bases: 
-            # Check for base
             if p_name in all_nodes:
                 active_primes.append(p_name)
-            
-            # Check for splits (is_1, is_2, etc.)
-            for node in all_nodes:
-                if node.startswith(p_name + "_") and node[len(p_name)+1:len(p_name)+2].isdigit():
-                     if node not in active_primes:
-                        active_primes.append(node)
+            active_primes.extend(variants.get(p_name, ()))
         
         # Phase XI.2: Valuation Migration & Primary Injection
         # Ensure split manifolds (is_1) inherit valuations from base primes (is).
         # This is critical for Deep Lifting.
-        new_tensor = self.gluer.global_tensor.copy()
+        # Updated in place: the edge set is unchanged, only each edge's
+        # valuation dict gains entries (a shallow copy of the outer dict
+        # would share those dicts anyway)
+        get_prime = self.mapper.get_prime
+        
+        def node_primes(node):
+            """(p_current, p_base), p_base None unless node is a split manifold."""
+            # If node is a prime relation (e.g., 'is' or 'is_1')
+            p_current = get_prime(node)
+            
+            # Check for base relation (if split)
+            if "_" in node:
+                parts = node.split("_")
+                if parts[0] in bases and parts[1].isdigit():
+                    return p_current, get_prime(parts[0])
+            return p_current, None
+        
+        # Resolved on first sight, in edge order: get_prime assigns new primes
+        # as it goes, so this keeps the registry order of an uncached walk
+        prime_cache = {}
+        
+        def migrate(node, vals):
+            primes = prime_cache.get(node)
+            if primes is None:
+                primes = prime_cache[node] = node_primes(node)
+            p_current, p_base = primes
+            
+            if p_base is None:
+                # Unsplit: max(val(p), val(p) or 1) only fills the default
+                vals.setdefault(p_current, 1) # Default to 1 if not in PMI
+                return
+            
+            # Migrate valuation: val(p_current) = max(val(p_current), val(p_base))
+            weight = vals.get(p_base, 1) # Default to 1 if not in PMI
+            vals[p_current] = max(vals.get(p_current, 0), weight)
+        
+        # Both endpoints, u first (no per-edge [u, v] list)
         for (u, v), vals in self.gluer.global_tensor.items():
-            for node in [u, v]:
-                # If node is a prime relation (e.g., 'is' or 'is_1')
-                p_current = self.mapper.get_prime(node)
-                
-                # Check for base relation (if split)
-                base_name = node
-                if "_" in node:
-                    parts = node.split("_")
-                    if parts[0] in bases and parts[1].isdigit():
-                        base_name = parts[0]
-                
-                p_base = self.mapper.get_prime(base_name)
-                
-                # Migrate valuation: val(p_current) = max(val(p_current), val(p_base))
-                weight = vals.get(p_base, 1) # Default to 1 if not in PMI
-                new_tensor[(u, v)][p_current] = max(new_tensor[(u, v)].get(p_current, 0), weight)
-                      
-        self.gluer.global_tensor = new_tensor
+            migrate(u, vals)
+            migrate(v, vals)
         
         # Now we lift
+        # (primes resolved here, in order, so the registry is never touched
+        # from a worker)
+        lift_jobs = []
         for p_name in active_primes:
-             # Lift
              p_val = self.mapper.get_prime(p_name)
-             if not p_val: continue
-             
-             print(f"   > Lifting Geometry for '{p_name}' (p={p_val})...")
-             self.lifter.p = p_val
-             coords = self.lifter.lift(self.gluer.global_tensor)
-             final_coords[p_name] = coords
-             
-              # Synthesize
-             poly = synth.synthesize(coords, p_name)
-             polynomials[p_name] = poly
+             if p_val:
+                 lift_jobs.append((p_name, p_val))
+        
+        if self.workers > 1 and len(lift_jobs) > 1:
+             # Primes lift independently against the same (read-only) tensor
+             with ProcessPoolExecutor(max_workers=min(self.workers, len(lift_jobs)),
+                                      initializer=_init_lift_worker,
+                                      initargs=(self.gluer.global_tensor,)) as ex:
+                 futures = []
+                 for p_name, p_val in lift_jobs:
+                     print(f"   > Lifting Geometry for '{p_name}' (p={p_val})...")
+                     futures.append(ex.submit(_lift_one, p_name, p_val))
+                 for (p_name, _), fut in zip(lift_jobs, futures):
+                     final_coords[p_name], polynomials[p_name] = fut.result()
+        else:
+             for p_name, p_val in lift_jobs:
+                 # Lift
+                 print(f"   > Lifting Geometry for '{p_name}' (p={p_val})...")
+                 self.lifter.p = p_val
+                 coords = self.lifter.lift(self.gluer.global_tensor)
+                 final_coords[p_name] = coords
+                 
+                 # Synthesize
+                 poly = synth.synthesize(coords, p_name)
+                 polynomials[p_name] = poly
         
         # Phase XXVI: Adelic Ball Collapse (Berkovich Tree)
         print("\n--- Phase XXVI: Adelic Ball Collapse ---")
@@ -1,5 +1,72 @@
 
 import re
+from functools import lru_cache
+
+# Trimming, compiled once (normalize runs per term of every triad): leading
+# brackets and trailing punctuation in one anchored scan. The two classes
+# are disjoint, so this equals stripping the tail and then the head.
+_TRIM_RE = re.compile(r'^[(\[]+|[.,;:)\]?!]+$')
+
+# Basic English plural rules (heuristic but fast); normalize applies
+# them through _PLURAL_RE
+_BASE_RULES = (
+    (r'ies$', 'y'),
+    (r's$', ''),
+)
+
+# Exceptions that should NOT be stemmed
+_EXCEPTIONS = frozenset({
+    'gas', 'mass', 'process', 'analysis', 'hypothesis', 'basis', 'radius',
+    'this', 'is', 'was', 'has', 'does', 'yes', 'us', 'bus', 'glass',
+    'class', 'grass', 'less', 'loss', 'pass', 'press', 'access',
+    'address', 'ass', 'boss', 'brass', 'chess', 'cross', 'dress',
+    'guess', 'kiss', 'mess', 'miss', 'moss', 'toss',
+    'series', 'species'
+})
+
+# Pronouns to purge (Request: Phase IX)
+_BLOCKLIST = frozenset({
+    'it', 'that', 'this', 'which', 'there', 'he', 'she', 'they', 'them', 'his', 'her', 'their'
+})
+
+# Both tables as one lookup: term -> fixed result (blocklist wins: 'this')
+_FIXED = {t: t for t in _EXCEPTIONS}
+_FIXED.update((t, "") for t in _BLOCKLIST)
+
+# Plural suffixes of _BASE_RULES, as one alternation ('ies' wins over 's')
+_PLURAL_RE = re.compile(r'(ies|s)$')
+
+# Terms repeat heavily across triads; normalize is pure over the module
+# tables, so results are memoized per distinct raw term
+@lru_cache(maxsize=65536)
+def _normalize(term):
+    """TermNormalizer.normalize without the instance (see there)."""
+    term = term.lower().strip()
+    
+    # Remove simple trailing punctuation (and leading brackets)
+    term = _TRIM_RE.sub('', term)
+    
+    if not term:
+        return ""
+        
+    # Check blocklist, then the words that must not be singularized
+    fixed = _FIXED.get(term)
+    if fixed is not None:
+        return fixed
+        
+    # Apply rules
+    # Only apply if length > 3 to avoid stemming short words like "is", "as"
+    if len(term) > 3:
+        m = _PLURAL_RE.search(term)
+        if m:
+            # Heuristic: If it ends in 'ss', it's likely an exception or non-plural
+            if term.endswith('ss'):
+                return term
+                
+            replacement = 'y' if m.group(1) == 'ies' else ''
+            return term[:m.start()] + replacement + term[m.end():]
+    
+    return term
 
 class TermNormalizer:
     """
@@ -7,25 +74,10 @@ class TermNormalizer:
     Merges plurals and singulars to reduce graph redundancy.
     """
     def __init__(self):
-        # Basic English plural rules (heuristic but fast)
-        self.rules = [
-            (r'ies$', 'y'),
-            (r's$', ''),
-        ]
-        # Exceptions that should NOT be stemmed
-        self.exceptions = {
-            'gas', 'mass', 'process', 'analysis', 'hypothesis', 'basis', 'radius',
-            'this', 'is', 'was', 'has', 'does', 'yes', 'us', 'bus', 'glass',
-            'class', 'grass', 'less', 'loss', 'pass', 'press', 'access',
-            'address', 'ass', 'boss', 'brass', 'chess', 'cross', 'dress',
-            'guess', 'kiss', 'mess', 'miss', 'moss', 'toss',
-            'series', 'species'
-        }
-        
-        # Pronouns to purge (Request: Phase IX)
-        self.blocklist = {
-            'it', 'that', 'this', 'which', 'there', 'he', 'she', 'they', 'them', 'his', 'her', 'their'
-        }
+        # Shared, immutable tables (see module constants)
+        self.rules = _BASE_RULES
+        self.exceptions = _EXCEPTIONS
+        self.blocklist = _BLOCKLIST
 
     def normalize(self, term):
         """
@@ -35,34 +87,4 @@ class TermNormalizer:
         3. Check blocklist
         4. Singularize
         """
-        term = term.lower().strip()
-        
-        # Remove simple trailing punctuation
-        term = re.sub(r'[.,;:)\]?!]+$', '', term)
-        term = re.sub(r'^[(\[]+', '', term)
-        
-        if not term:
-            return ""
-            
-        # Check blocklist
-        if term in self.blocklist:
-            return ""
-            
-        # Singularize
-        if term in self.exceptions:
-            return term
-            
-        # Apply rules
-        # Only apply if length > 3 to avoid stemming short words like "is", "as"
-        if len(term) > 3:
-            for pattern, replacement in self.rules:
-                if re.search(pattern, term):
-                    # Check exceptions again after potential strip? 
-                    # No, check before.
-                    # Heuristic: If it ends in 'ss', it's likely an exception or non-plural
-                    if term.endswith('ss'):
-                        return term
-                        
-                    return re.sub(pattern, replacement, term)
-        
-        return term
+        return _normalize(term)
@@ -1,13 +1,68 @@
+import functools
+import math
+import numpy as np
 from src.logic_miner.core.solver import ModularSolver
 from src.logic_miner.core.adelic import AdelicIntegrator
 
+@functools.lru_cache(maxsize=None)
+def _bsgs_table(alpha, p):
+    """
+    Baby steps for discrete_log: (m, {alpha^j mod p: j}) for j < m, keeping
+    the smallest j per value so the first hit is the smallest exponent.
+    """
+    m = math.isqrt(p - 1) + 1
+    table = {}
+    val = 1
+    for j in range(m):
+        table.setdefault(val, j)
+        val = (val * alpha) % p
+    return m, table
+
+# Largest modulus whose Fermat inverses are tabulated (one list of p ints)
+INV_TABLE_MAX_P = 1 << 16
+
+@functools.lru_cache(maxsize=None)
+def _inv_table(p):
+    """[n^(p-2) mod p for n < p]: solve_sparse_prony's inv(n) as a lookup."""
+    return [pow(n, p - 2, p) for n in range(p)]
+
+def discrete_log(u, alpha, p):
+    """
+    Smallest e >= 0 with alpha^e = u (mod p), or -1 (baby-step/giant-step,
+    O(sqrt p) instead of a linear scan over exponents).
+    """
+    u %= p
+    if alpha % p == 0:
+        # alpha^0 = 1, then 0 forever
+        return 0 if u == 1 else (1 if u == 0 else -1)
+    m, table = _bsgs_table(alpha, p)
+    giant = pow(alpha, -m, p)
+    gamma = u
+    for i in range(m):
+        j = table.get(gamma)
+        if j is not None:
+            return i * m + j
+        gamma = (gamma * giant) % p
+    return -1
+
+def modpow_vec(x, e, m):
+    """Elementwise x^e mod m for an int64 array (square-and-multiply, m < 2^31)."""
+    result = np.ones_like(x) % m
+    base = x % m
+    while e > 0:
+        if e & 1:
+            result = (result * base) % m
+        base = (base * base) % m
+        e >>= 1
+    return result
+
 def solve_sparse_prony(points, p):
     """
     Simulated Sparse Solver (from research_sparse.py)
     Returns {'params': (c, e), 'type': 'SPARSE_MONOMIAL'} or None.
     """
     # 1. Collect y_k for k=0..N (x=2^k)
-    lookup = {pt[0]: pt[1] for pt in points}
+    lookup = dict(points) # (x, y) pairs, any iterable (e.g. zip(X, Y))
     alpha = 2
     sequence = []
     k = 0
@@ -34,7 +89,12 @@ def solve_sparse_prony(points, p):
     
     diffs = [(sequence[i+1] - sequence[i]) % p for i in range(len(sequence)-1)]
     
-    def inv(n): return pow(n, p-2, p)
+    if p <= INV_TABLE_MAX_P:
+        # Built once per prime and shared across calls
+        inv_table = _inv_table(p)
+        def inv(n): return inv_table[n % p]
+    else:
+        def inv(n): return pow(n, p-2, p)
     
     ratios = []
     valid = True
@@ -55,11 +115,7 @@ def solve_sparse_prony(points, p):
     if len(set(ratios)) == 1:
         u = ratios[0]
         # u = 2^e mod p
-        e = -1
-        for candidate_e in range(100):
-             if pow(alpha, candidate_e, p) == u:
-                 e = candidate_e
-                 break
+        e = discrete_log(u, alpha, p)
         
         if e != -1:
             # Found e. Now find c.
@@ -89,22 +145,24 @@ def nightmare_demo():
     print("\n--- Target 1: 3x^13 + 7 (Mod 6) ---")
     
     # Split Mod 6 -> Mod 2, Mod 3.
-    X = list(range(100))
-    Y = [(3*pow(x, 13) + 7) % 6 for x in X]
+    # Projections are vectorized; the solver takes plain ints (tolist)
+    xs = np.arange(100, dtype=np.int64)
+    X = xs.tolist()
+    Y = (3 * modpow_vec(xs, 13, 6) + 7) % 6
     
     # Mod 2 projection
     print(">> Processing Mod 2...")
-    Y2 = [y % 2 for y in Y]
+    Y2 = (Y % 2).tolist()
     # Solve Sparse Mod 2
-    res2 = solve_sparse_prony(list(zip(X, Y2)), 2)
+    res2 = solve_sparse_prony(zip(X, Y2), 2)
     print(f"Mod 2 Result: {res2}")
     # Mod 2: 3x^13 + 7 = 1x^13 + 1 = x + 1.
     # Sparse should find c=1, e=1, d=1.
     
     # Mod 3 projection
     print(">> Processing Mod 3...")
-    Y3 = [y % 3 for y in Y]
-    res3 = solve_sparse_prony(list(zip(X, Y3)), 3)
+    Y3 = (Y % 3).tolist()
+    res3 = solve_sparse_prony(zip(X, Y3), 3)
     print(f"Mod 3 Result: {res3}")
     # Mod 3: 3x^13 + 7 = 0 + 1 = 1.
     # Sparse should find Constant d=1.
@@ -127,21 +185,21 @@ def nightmare_demo():
     p2 = 101
     M = p1 * p2
     
-    Y_night = [(5*pow(x, 13, M) + 7) % M for x in X]
+    Y_night = (5 * modpow_vec(xs, 13, M) + 7) % M
     
     # Split
     print(f">> Processing Mod {p1}...")
-    Y_p1 = [y % p1 for y in Y_night]
+    Y_p1 = (Y_night % p1).tolist()
     # 5x^13 + 7 mod 3 = 2x^13 + 1.
     # x^13 mod 3 = x.
     # So 2x + 1.
-    res_p1 = solve_sparse_prony(list(zip(X, Y_p1)), p1)
+    res_p1 = solve_sparse_prony(zip(X, Y_p1), p1)
     print(f"Mod {p1} Result: {res_p1}")
     
     print(f">> Processing Mod {p2}...")
-    Y_p2 = [y % p2 for y in Y_night]
+    Y_p2 = (Y_night % p2).tolist()
     # 5x^13 + 7 mod 101.
-    res_p2 = solve_sparse_prony(list(zip(X, Y_p2)), p2)
+    res_p2 = solve_sparse_prony(zip(X, Y_p2), p2)
     print(f"Mod {p2} Result: {res_p2}")
     
     if res_p2 and res_p2['params'][1] == 13:
@@ -0,0 +1,96 @@
+import os
+import hashlib
+import tempfile
+
+try:
+    import fitz # PyMuPDF
+except ImportError:
+    fitz = None
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache")
+
+# Tags the on-disk cache: the two backends do not extract identical text
+BACKEND = "fitz" if fitz is not None else "pypdf"
+
+class _FitzPage:
+    """One page handle; the page is only parsed when its text is asked for."""
+    __slots__ = ("_doc", "_index")
+
+    def __init__(self, doc, index):
+        self._doc = doc
+        self._index = index
+
+    def extract_text(self):
+        return self._doc.load_page(self._index).get_text("text")
+
+class _FitzPages:
+    """Lazy reader.pages: len() and integer indexing, nothing parsed up front."""
+    __slots__ = ("_doc",)
+
+    def __init__(self, doc):
+        self._doc = doc
+
+    def __len__(self):
+        return self._doc.page_count
+
+    def __getitem__(self, i):
+        n = self._doc.page_count
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("page index out of range")
+        return _FitzPage(self._doc, i)
+
+class FitzReader:
+    """
+    PdfReader stand-in backed by PyMuPDF, for the fit_stream callers that
+    index reader.pages (windows overlap, so a one-shot generator won't do).
+    """
+    def __init__(self, path):
+        self.doc = fitz.open(path)
+        self.pages = _FitzPages(self.doc)
+
+def open_pdf(path):
+    """A reader exposing .pages[i].extract_text(): PyMuPDF if installed, else pypdf."""
+    if fitz is not None:
+        return FitzReader(path)
+    from pypdf import PdfReader
+    return PdfReader(path)
+
+def iter_pages(path, start=0, end=None):
+    """Yields the text of pages [start, end) one at a time."""
+    pages = open_pdf(path).pages
+    for i in range(start, len(pages) if end is None else end):
+        yield pages[i].extract_text()
+
+def page_count(path):
+    """Number of pages in a PDF (opens the document, parses no page)."""
+    return len(open_pdf(path).pages)
+
+def load_pages(path, start, end):
+    """
+    Text of pages [start, end) of a PDF, one "\n" after each page.
+    Extraction is memoized on disk, keyed by (path, start, end, mtime,
+    backend), so repeat audits skip the PDF parser entirely.
+    """
+    key = f"{os.path.abspath(path)}|{start}|{end}|{os.path.getmtime(path)}|{BACKEND}"
+    cache_path = os.path.join(CACHE_DIR, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".txt")
+
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8", newline="") as f:
+            return f.read()
+
+    text = "".join(page + "\n" for page in iter_pages(path, start, end))
+
+    # Write a temp file and rename it into place, so an interrupted or
+    # concurrent run never leaves a truncated entry at cache_path
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return text
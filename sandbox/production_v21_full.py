@@ -1,102 +1,97 @@
 
 import sys
 import os
-import json
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from logic_miner.engine import LogicMiner
-from collections import Counter
-from pypdf import PdfReader
+from pdf_cache import open_pdf, iter_pages
+from audit_template import header, section, footer, concept_lines
+
+# Pages per extraction task: large enough to amortize each worker's PDF open
+EXTRACT_CHUNK_PAGES = 100
+
+def _extract_pages(pdf_path, start, end):
+    """
+    Text of pages [start, end), one "\n" after each page, from a reader
+    opened in this process. Top-level so it pickles into the process pool.
+    """
+    return "".join(page + "\n" for page in iter_pages(pdf_path, start, end))
+
+# Static sections of the V.21 audit (layout in audit_template)
+V21_SPEC = """\
+1. SPECTRAL GATEKEEPER: Tri-Axial Filtration (H-C-A-F)
+   Method: Directed Association Entropy + Local Clustering Coefficient.
+   Goal: Isolating Root Concepts from Scaffolding/Boilerplate.
+
+2. DYNAMIC ADELIC SHAKE: Rotational Invariance Test
+   Method: N-prime manifold intersection (N >= 3).
+   metric: Root Preservation Rate (RPR) > 0.9.
+
+3. ALGEBRAIC LIFTING: P-adic Lagrange Synthesis
+   Method: Map entities to p-adic coordinates {x_i} satisfying f(x_i)=0.
+   Prime Field: Auto-tuned Dominant Prime (p_dom)."""
+
+V21_PARAMS = """\
+Base Primes:       [3, 5, 7]
+Manifold Expansion: [11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
+Spectral Gamma:    H > 1.0, C > 0.03, F_protect > 0.15
+Solver Mode:       ALGEBRAIC_TEXT"""
 
 def generate_audit_report(result, run_time, page_count):
     """
     Generates a high-fidelity audit dump for external agents.
     """
-    report = []
-    report.append("======================================================================")
-    report.append("   LOGIC MINER ENGINE - FINAL PRODUCTION AUDIT (PROTOCOL V.21)")
-    report.append("======================================================================")
-    report.append(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append(f"Corpus: Chemistry 2e (Full Volume)")
-    report.append(f"Processing Depth: {page_count} Pages")
-    report.append(f"Total Execution Time: {run_time:.2f} seconds")
-    report.append("\n" + "-"*70)
-    report.append("ARCHITECTURAL SPECIFICATION (PROTOCOL V.21 - ADELIC CORE)")
-    report.append("-"*70)
-    report.append("1. SPECTRAL GATEKEEPER: Tri-Axial Filtration (H-C-A-F)")
-    report.append("   Method: Directed Association Entropy + Local Clustering Coefficient.")
-    report.append("   Goal: Isolating Root Concepts from Scaffolding/Boilerplate.")
-    report.append("\n2. DYNAMIC ADELIC SHAKE: Rotational Invariance Test")
-    report.append("   Method: N-prime manifold intersection (N >= 3).")
-    report.append("   metric: Root Preservation Rate (RPR) > 0.9.")
-    report.append("\n3. ALGEBRAIC LIFTING: P-adic Lagrange Synthesis")
-    report.append("   Method: Map entities to p-adic coordinates {x_i} satisfying f(x_i)=0.")
-    report.append("   Prime Field: Auto-tuned Dominant Prime (p_dom).")
-    
-    report.append("\n" + "-"*70)
-    report.append("ENGINE PARAMETERS")
-    report.append("-"*70)
-    report.append("Base Primes:       [3, 5, 7]")
-    report.append("Manifold Expansion: [11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]")
-    report.append("Spectral Gamma:    H > 1.0, C > 0.03, F_protect > 0.15")
-    report.append("Solver Mode:       ALGEBRAIC_TEXT")
-    
-    report.append("\n" + "-"*70)
-    report.append("GLOBAL METRICS")
-    report.append("-"*70)
-    report.append(f"Root Entities:     {len(result['entities'])}")
-    report.append(f"Filtered Junk:    {sum(1 for v in result['classification'].values() if v == 'JUNK')}")
-    report.append(f"Scaffolding:       {sum(1 for v in result['classification'].values() if v == 'SCAFFOLDING')}")
-    report.append(f"Analytic Fidelity: {result.get('analytic_score', '0.00')}")
-    report.append(f"Dominant Prime:    p={result.get('dominant_prime', 'N/A')}")
-    
-    report.append("\n" + "-"*70)
-    report.append("CONCEPT TRACE & COORDINATES")
-    report.append("-"*70)
-    coords = result['coordinates']
     classific = result['classification']
-    for ent in sorted(result['entities']):
-        p_val = coords.get(ent, 0)
-        report.append(f"{ent.ljust(30)} | Coord: {str(p_val).ljust(10)} | Logic: {classific.get(ent)}")
-    
-    report.append("\n" + "-"*70)
-    report.append("REACTION HYPER-EDGES")
-    report.append("-"*70)
     reactions = result.get('reactions', [])
-    if not reactions:
-        report.append("No hyper-edges detected in this volume.")
-    for r1, r2, prod in reactions:
-        report.append(f"{r1} + {r2} --> {prod}")
-
-    report.append("\n" + "-"*70)
-    report.append("FINAL POLYNOMIAL (THE ALGEBRAIC CORE)")
-    report.append("-"*70)
-    report.append(f"Defining Polynomial f(x):\n{result['polynomial']}")
-    report.append("\n" + "="*70)
-    report.append("   AUDIT COMPLETE - SHA256 CONSISTENCY: OK")
-    report.append("="*70)
+    if reactions:
+        reaction_lines = [f"{r1} + {r2} --> {prod}" for r1, r2, prod in reactions]
+    else:
+        reaction_lines = ["No hyper-edges detected in this volume."]
     
-    return "\n".join(report)
+    return "\n".join([
+        header("V.21", page_count, run_time),
+        section("ARCHITECTURAL SPECIFICATION (PROTOCOL V.21 - ADELIC CORE)", [V21_SPEC]),
+        section("ENGINE PARAMETERS", [V21_PARAMS]),
+        section("GLOBAL METRICS", [
+            f"Root Entities:     {len(result['entities'])}",
+            f"Filtered Junk:    {sum(1 for v in classific.values() if v == 'JUNK')}",
+            f"Scaffolding:       {sum(1 for v in classific.values() if v == 'SCAFFOLDING')}",
+            f"Analytic Fidelity: {result.get('analytic_score', '0.00')}",
+            f"Dominant Prime:    p={result.get('dominant_prime', 'N/A')}",
+        ]),
+        section("CONCEPT TRACE & COORDINATES",
+                concept_lines(sorted(result['entities']), result['coordinates'], classific)),
+        section("REACTION HYPER-EDGES", reaction_lines),
+        section("FINAL POLYNOMIAL (THE ALGEBRAIC CORE)",
+                [f"Defining Polynomial f(x):\n{result['polynomial']}"]),
+        footer("SHA256 CONSISTENCY: OK"),
+    ])
 
 def main():
     print("--- [Logic Miner V.21 - Final Production Run] ---")
     miner = LogicMiner()
     
     pdf_path = "d:/Dropbox/logic-miner-engine/texts/Chemistry2e-WEB.pdf"
-    reader = PdfReader(pdf_path)
+    reader = open_pdf(pdf_path)
     total_pages = len(reader.pages)
     
     start_time = time.time()
     
-    full_text = ""
     print(f"   > Extracting Text from {total_pages} pages...")
-    for i, page in enumerate(reader.pages):
-        full_text += page.extract_text() + "\n"
-        if i % 200 == 0 and i > 0:
-            print(f"     * Progress: {i}/{total_pages} pages...")
+    # extract_text is pure Python (GIL-bound), so page ranges fan out across
+    # processes; map() keeps them in page order and the parts join once
+    starts = range(0, total_pages, EXTRACT_CHUNK_PAGES)
+    ends = [min(s + EXTRACT_CHUNK_PAGES, total_pages) for s in starts]
+    parts = []
+    with ProcessPoolExecutor(max_workers=os.cpu_count() or 1) as ex:
+        for end, text in zip(ends, ex.map(_extract_pages, [pdf_path] * len(ends), starts, ends)):
+            parts.append(text)
+            print(f"     * Progress: {end}/{total_pages} pages...")
+    full_text = "".join(parts)
             
     print("   > Text extraction complete. Initiating Algebraic Mining...")
     
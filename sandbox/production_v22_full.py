@@ -1,87 +1,54 @@
 
 import sys
 import os
-import json
 import time
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from logic_miner.engine import LogicMiner
-from collections import Counter
-from pypdf import PdfReader
+from pdf_cache import open_pdf
+from audit_template import header, section, footer, spline_trace_lines, concept_lines
+
+# Static sections of the V.22 audit (layout in audit_template)
+V22_SPEC = """\
+1. SPECTRAL GATEKEEPER: Block-level Tri-Axial Filtration
+   Goal: Isolating Root Concepts progressively to minimize local noise.
+
+2. ADELIC SHAKE: Block-level Consistence Check
+   Goal: Pruning geometric ghosts at ingestion time.
+
+3. MANIFOLD ROTATION (SPLINING): Energy-driven Synthesis
+   Goal: Switching primary primes (p) as the semantic manifold shifts."""
 
 def generate_audit_report(result, run_time, page_count):
     """
     Generates a high-fidelity audit dump for external agents.
     Includes the Spline Trace (Protocol V.22).
     """
-    report = []
-    report.append("======================================================================")
-    report.append("   LOGIC MINER ENGINE - FINAL PRODUCTION AUDIT (PROTOCOL V.22)")
-    report.append("======================================================================")
-    report.append(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append(f"Corpus: Chemistry 2e (Full Volume)")
-    report.append(f"Processing Depth: {page_count} Pages")
-    report.append(f"Total Execution Time: {run_time:.2f} seconds")
-    report.append("\n" + "-"*70)
-    report.append("ARCHITECTURAL SPECIFICATION (PROTOCOL V.22 - SERIAL SPLINE)")
-    report.append("-"*70)
-    report.append("1. SPECTRAL GATEKEEPER: Block-level Tri-Axial Filtration")
-    report.append("   Goal: Isolating Root Concepts progressively to minimize local noise.")
-    report.append("\n2. ADELIC SHAKE: Block-level Consistence Check")
-    report.append("   Goal: Pruning geometric ghosts at ingestion time.")
-    report.append("\n3. MANIFOLD ROTATION (SPLINING): Energy-driven Synthesis")
-    report.append("   Goal: Switching primary primes (p) as the semantic manifold shifts.")
-    
-    report.append("\n" + "-"*70)
-    report.append("MANIFOLD SPLINE TRACE (The 'Spline')")
-    report.append("-"*70)
-    trace = result.get('spline_trace', [])
-    if not trace:
-        report.append("No spline trace available (Monolithic fallback).")
-    else:
-        report.append(f"{'BLOCK'.ljust(8)} | {'PRIME'.ljust(6)} | {'ENERGY'.ljust(8)} | {'POLYNOMIAL SAMPLE'}")
-        report.append("-"*70)
-        for point in trace:
-            b = str(point['block']).ljust(8)
-            p = str(point['p']).ljust(6)
-            e = f"{point['energy']:.4f}".ljust(8)
-            poly_str = str(point['polynomial'][:3]) + "..."
-            report.append(f"{b} | {p} | {e} | {poly_str}")
-
-    report.append("\n" + "-"*70)
-    report.append("GLOBAL METRICS")
-    report.append("-"*70)
-    report.append(f"Global Stable Roots: {len(result['entities'])}")
-    report.append(f"Active Anchors:      {len(result.get('anchors', []))}")
-    report.append(f"Manifold State:      p={result.get('p', 'N/A')}")
-    
-    report.append("\n" + "-"*70)
-    report.append("CONCEPT TRACE & COORDINATES")
-    report.append("-"*70)
-    coords = result['coordinates']
-    classific = result.get('classification', {})
-    for ent in sorted(result['entities']):
-        p_val = coords.get(ent, 0)
-        report.append(f"{ent.ljust(30)} | Coord: {str(p_val).ljust(10)} | Logic: {classific.get(ent, 'CONCEPT')}")
-
-    report.append("\n" + "-"*70)
-    report.append("FINAL GLOBAL POLYNOMIAL (CRYSTAL DEFENSOR)")
-    report.append("-"*70)
-    report.append(f"Defining Polynomial f(x):\n{result['polynomial']}")
-    report.append("\n" + "="*70)
-    report.append("   AUDIT COMPLETE - SHA256 CONSISTENCY: OK")
-    report.append("="*70)
-    
-    return "\n".join(report)
+    return "\n".join([
+        header("V.22", page_count, run_time),
+        section("ARCHITECTURAL SPECIFICATION (PROTOCOL V.22 - SERIAL SPLINE)", [V22_SPEC]),
+        section("MANIFOLD SPLINE TRACE (The 'Spline')", spline_trace_lines(result.get('spline_trace', []))),
+        section("GLOBAL METRICS", [
+            f"Global Stable Roots: {len(result['entities'])}",
+            f"Active Anchors:      {len(result.get('anchors', []))}",
+            f"Manifold State:      p={result.get('p', 'N/A')}",
+        ]),
+        section("CONCEPT TRACE & COORDINATES",
+                concept_lines(sorted(result['entities']), result['coordinates'],
+                              result.get('classification', {}), default='CONCEPT')),
+        section("FINAL GLOBAL POLYNOMIAL (CRYSTAL DEFENSOR)",
+                [f"Defining Polynomial f(x):\n{result['polynomial']}"]),
+        footer("SHA256 CONSISTENCY: OK"),
+    ])
 
 def main():
     print("--- [Logic Miner V.22 - Final Production Run] ---")
     miner = LogicMiner()
     
     pdf_path = "d:/Dropbox/logic-miner-engine/texts/Chemistry2e-WEB.pdf"
-    reader = PdfReader(pdf_path)
+    reader = open_pdf(pdf_path)
     total_pages = len(reader.pages)
     
     start_time = time.time()
@@ -8,7 +8,7 @@ import time
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from logic_miner.engine import LogicMiner
-from pypdf import PdfReader
+from pdf_cache import open_pdf
 
 def generate_audit_report(result, run_time, page_count):
     report = []
@@ -48,7 +48,7 @@ def main():
     miner = LogicMiner()
     
     pdf_path = "d:/Dropbox/logic-miner-engine/texts/Chemistry2e-WEB.pdf"
-    reader = PdfReader(pdf_path)
+    reader = open_pdf(pdf_path)
     total_pages = len(reader.pages)
     
     start_time = time.time()
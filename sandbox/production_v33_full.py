@@ -8,7 +8,7 @@ import time
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from logic_miner.core.serial_synthesis_v33 import SerialSynthesizerV33
-from pypdf import PdfReader
+from pdf_cache import open_pdf
 
 def get_system_documentation():
     return """
@@ -94,7 +94,7 @@ def main():
     print("--- [Logic Miner V.33 - Experimental Run] ---")
     
     pdf_path = "d:/Dropbox/logic-miner-engine/texts/Chemistry2e-WEB.pdf"
-    reader = PdfReader(pdf_path)
+    reader = open_pdf(pdf_path)
     # Full Run implies all pages
     total_pages = len(reader.pages)
     
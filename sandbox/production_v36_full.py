@@ -7,7 +7,7 @@ import time
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from logic_miner.core.serial_synthesis_v36 import SerialSynthesizerV36
-from pypdf import PdfReader
+from pdf_cache import open_pdf
 
 def get_system_documentation():
     return """
@@ -84,7 +84,7 @@ def main():
     print("--- [Logic Miner V.36 - Flow Conservation Run] ---")
     
     pdf_path = "d:/Dropbox/logic-miner-engine/texts/Chemistry2e-WEB.pdf"
-    reader = PdfReader(pdf_path)
+    reader = open_pdf(pdf_path)
     total_pages = len(reader.pages)
     
     start_time = time.time()
@@ -7,7 +7,7 @@ import time
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from logic_miner.core.serial_synthesis_v41 import SerialSynthesizerV41
-from pypdf import PdfReader
+from pdf_cache import open_pdf
 
 def main():
     print("--- [Logic Miner V.41 - Adelic Restoration (The Global Concept)] ---")
@@ -15,7 +15,7 @@ def main():
     print("   > Metric: Kolmogorov Complexity K(x) = |GlobalVal| / Modulus")
     
     pdf_path = "d:/Dropbox/logic-miner-engine/texts/Chemistry2e-WEB.pdf"
-    reader = PdfReader(pdf_path)
+    reader = open_pdf(pdf_path)
     
     pages_to_scan = 400
     
@@ -8,7 +8,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from logic_miner.engine import LogicMiner
 from logic_miner.core.serial_synthesis_v50 import SerialSynthesizerV50
-from pypdf import PdfReader
+from pdf_cache import open_pdf
 
 def generate_tree_report(synthesizer, run_time, page_count):
     report = []
@@ -87,7 +87,7 @@ def main():
     print("--- [Logic Miner V.50 - The Restoration] ---")
     
     pdf_path = "d:/Dropbox/logic-miner-engine/texts/Chemistry2e-WEB.pdf"
-    reader = PdfReader(pdf_path)
+    reader = open_pdf(pdf_path)
     
     # Run 1200 pages (Full Restoration)
     pages_to_run = 1200
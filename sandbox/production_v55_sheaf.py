@@ -5,7 +5,7 @@ import time
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from logic_miner.core.serial_synthesis_v55 import SerialSynthesizerV55
-from pypdf import PdfReader
+from pdf_cache import open_pdf
 
 def generate_tree_report_v55(synthesizer, run_time, page_count):
     report = []
@@ -67,7 +67,7 @@ def main():
     print("--- [Logic Miner V.55 - Sheaf Splining] ---")
     
     pdf_path = "d:/Dropbox/logic-miner-engine/texts/Chemistry2e-WEB.pdf"
-    reader = PdfReader(pdf_path)
+    reader = open_pdf(pdf_path)
     
     pages_to_run = 1200
     
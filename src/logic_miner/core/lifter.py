@@ -1,4 +1,16 @@
 from .solver import ModularSolver
+import numpy as np
+
+
+def _mod_residues(values, p):
+    """
+    values % p as a list, reduced in one NumPy call when the values are
+    machine integers (big ints / floats keep Python semantics).
+    """
+    arr = np.asarray(values)
+    if arr.dtype.kind == 'i':
+        return np.mod(arr, p).tolist()
+    return [v % p for v in values]
 
 class HenselLifter:
     def __init__(self, p_base):
@@ -37,11 +49,9 @@ class HenselLifter:
                 continue
                 
             # 1. RANSAC for current layer
-            data_mod_p = []
-            for idx_in_list, original_idx in enumerate(branch['active_indices']):
-                x_val = inputs[original_idx]
-                y_val = branch['current_outputs'][idx_in_list]
-                data_mod_p.append((x_val, y_val % self.p))
+            y_mod_p = _mod_residues(branch['current_outputs'], self.p)
+            data_mod_p = [(inputs[original_idx], y_mod_p[idx_in_list])
+                          for idx_in_list, original_idx in enumerate(branch['active_indices'])]
                 
             if branch['is_multivariate']:
                 result = self.solver.ransac_multivariate(data_mod_p, iterations=50)
@@ -1,9 +1,14 @@
 import math
 import random
+import numpy as np
 
 def get_valuation(n, p):
     if n == 0:
         return float('inf')
+    if p == 2 and isinstance(n, int):
+        # 2-adic valuation = trailing zero bits (lowest set bit of |n|)
+        n = abs(n)
+        return (n & -n).bit_length() - 1
     v = 0
     while n % p == 0:
         v += 1
@@ -54,3 +59,46 @@ def calculate_lipschitz_violation(inputs, outputs, p, samples=100):
         total_checks += 1
         
     return violations / total_checks if total_checks > 0 else 0.0
+
+# The int64 path reduces x and params mod M, so a*x stays below M^2:
+# it only cannot wrap while M < 2^31. Larger moduli take the exact loop.
+INT64_FIDELITY_MAX_M = 1 << 31
+
+def int64_or_none(values):
+    """
+    values as an int64 array, or None if any value is not an integer
+    or does not fit (callers then keep exact Python-int arithmetic).
+    """
+    if not all(isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in values):
+        return None
+    try:
+        return np.asarray(values, dtype=np.int64)
+    except OverflowError:
+        return None
+
+def modular_fidelity(inputs, outputs, params, degree, M, x_arr=None, y_arr=None):
+    """
+    Fraction of points where the degree-0/1 model agrees with y modulo M.
+    x_arr, y_arr: optional int64 copies of inputs/outputs (see int64_or_none).
+    They are used, vectorized, only when M < INT64_FIDELITY_MAX_M; otherwise
+    the points are scored with exact Python-int arithmetic.
+    """
+    n = len(inputs)
+    if n == 0:
+        return 0.0
+    if x_arr is not None and y_arr is not None and M < INT64_FIDELITY_MAX_M:
+        if degree == 1:
+            pred = ((params[0] % M) * (x_arr % M) + params[1] % M) % M
+        elif degree == 0:
+            pred = np.full(x_arr.shape, params[0] % M, dtype=np.int64)
+        else:
+            pred = np.zeros(x_arr.shape, dtype=np.int64)
+        return np.count_nonzero(pred == y_arr % M) / n
+
+    hits = 0
+    for x, y in zip(inputs, outputs):
+        pred = 0
+        if degree == 1: pred = (params[0]*x + params[1]) % M
+        elif degree == 0: pred = params[0] % M
+        if pred == y % M: hits += 1
+    return hits / n
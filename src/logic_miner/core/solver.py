@@ -1,6 +1,8 @@
 import random
 import math
 import concurrent.futures
+from .solver_numba import (ransac_poly_kernel, encode_points, poly_inlier_mask,
+                           NUMBA_MIN_POINTS, NUMBA_MAX_P)
 
 class ModularSolver:
     def __init__(self, p):
@@ -417,6 +419,12 @@ class ModularSolver:
         return self.ransac(data, iterations, max_degree)
 
     def _ransac_poly(self, data, iterations, degree):
+        # Integer 1D data: run the whole sample/solve/score loop compiled
+        if (ransac_poly_kernel is not None and degree <= 3 and self.p < NUMBA_MAX_P
+                and len(data) >= NUMBA_MIN_POINTS
+                and isinstance(data[0][0], int) and isinstance(data[0][1], int)):
+            return self._ransac_poly_compiled(data, iterations, degree)
+            
         best_model = None
         best_inliers = []
         n_sample = degree + 1
@@ -466,3 +474,28 @@ class ModularSolver:
             'valuation_slope': slope,
             'newton_profile': profile
         }
+
+    def _ransac_poly_compiled(self, data, iterations, degree):
+        """
+        _ransac_poly via the numba kernel. Same result structure; the
+        kernel seed is drawn from `random`, so random.seed() stays authoritative.
+        """
+        xr, ysr, yc = encode_points(data, self.p)
+        params, count = ransac_poly_kernel(xr, ysr, yc, self.p, iterations, degree,
+                                           random.getrandbits(32))
+        
+        best_model = None
+        best_inliers = []
+        if count > 0:
+            best_model = tuple(int(c) for c in params)
+            mask = poly_inlier_mask(xr, yc, best_model, self.p)
+            best_inliers = [data[i] for i in mask.nonzero()[0]]
+            
+        slope, profile = self._calculate_newton_slope(best_inliers)
+        return {
+            'model': best_model,
+            'inliers': best_inliers,
+            'ratio': len(best_inliers) / len(data) if data else 0,
+            'valuation_slope': slope,
+            'newton_profile': profile
+        }
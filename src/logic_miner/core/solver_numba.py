@@ -0,0 +1,124 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Below this many points the one-off array conversion costs more than the
+# interpreted RANSAC loop saves.
+NUMBA_MIN_POINTS = 64
+
+# Kernel arithmetic keeps every product below p^2, so p must fit in 31 bits.
+NUMBA_MAX_P = 1 << 31
+
+
+def _inv_mod(a, p):
+    """Fermat inverse a^(p-2) mod p (3-arg pow is not available in nopython)."""
+    result = 1
+    base = a % p
+    e = p - 2
+    while e > 0:
+        if e & 1:
+            result = (result * base) % p
+        base = (base * base) % p
+        e >>= 1
+    return result
+
+
+def _ransac_poly_loops(xr, ysr, yc, p, iters, degree, seed):
+    """
+    RANSAC for y = poly(x) (mod p) over int64 arrays.
+    xr, ysr: x and y reduced mod p (used to solve the sample).
+    yc: y where 0 <= y < p, else -1 (used to score, matching the
+        interpreted `poly(x) % p == y` check).
+    Returns (best_params, best_count); params are highest degree first,
+    best_count is 0 if no sample produced a model.
+    """
+    np.random.seed(seed)
+    n = xr.size
+    k = degree + 1
+    perm = np.arange(n)
+    params = np.zeros(k, dtype=np.int64)
+    best_params = np.zeros(k, dtype=np.int64)
+    best_count = 0
+    num = np.zeros(k, dtype=np.int64)
+
+    for _ in range(iters):
+        # Partial Fisher-Yates: perm[:k] is a uniform sample without replacement
+        for t in range(k):
+            j = np.random.randint(t, n)
+            tmp = perm[t]
+            perm[t] = perm[j]
+            perm[j] = tmp
+
+        # Distinct x (mod p), else the Vandermonde system is singular
+        singular = False
+        for a in range(k):
+            for b in range(a + 1, k):
+                if xr[perm[a]] == xr[perm[b]]:
+                    singular = True
+        if singular: continue
+
+        # Lagrange interpolation: params = sum_i y_i * prod_{j!=i} (x - x_j)/(x_i - x_j)
+        for t in range(k):
+            params[t] = 0
+        for a in range(k):
+            xi = xr[perm[a]]
+            for t in range(k):
+                num[t] = 0
+            num[0] = 1 # low-order first while building
+            den = 1
+            deg = 0
+            for b in range(k):
+                if a == b: continue
+                xj = xr[perm[b]]
+                den = (den * (xi - xj)) % p
+                deg += 1
+                for t in range(deg, -1, -1):
+                    prev = num[t - 1] if t > 0 else 0
+                    num[t] = (prev - xj * num[t]) % p
+            term = (ysr[perm[a]] * _inv_mod(den, p)) % p
+            for t in range(k):
+                params[degree - t] = (params[degree - t] + term * num[t]) % p
+
+        # Score (Horner)
+        count = 0
+        for i in range(n):
+            acc = 0
+            for t in range(k):
+                acc = (acc * xr[i] + params[t]) % p
+            if acc == yc[i]:
+                count += 1
+
+        if count > best_count:
+            best_count = count
+            for t in range(k):
+                best_params[t] = params[t]
+
+    return best_params, best_count
+
+
+if njit is not None:
+    _inv_mod = njit(cache=True)(_inv_mod)
+    ransac_poly_kernel = njit(cache=True)(_ransac_poly_loops)
+else:
+    ransac_poly_kernel = None
+
+
+def encode_points(data, p):
+    """
+    Packs 1D (x, y) integer pairs into the kernel's (xr, ysr, yc) arrays.
+    """
+    xr = np.fromiter((d[0] % p for d in data), dtype=np.int64, count=len(data))
+    ysr = np.fromiter((d[1] % p for d in data), dtype=np.int64, count=len(data))
+    yc = np.fromiter((d[1] if 0 <= d[1] < p else -1 for d in data), dtype=np.int64, count=len(data))
+    return xr, ysr, yc
+
+
+def poly_inlier_mask(xr, yc, params, p):
+    """Vectorized Horner check of poly(x) % p == y for a solved model."""
+    acc = np.zeros(xr.size, dtype=np.int64)
+    for c in params:
+        acc = (acc * xr + c) % p
+    return acc == yc
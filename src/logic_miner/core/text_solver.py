@@ -1,6 +1,91 @@
-import random
+import heapq
+import os
+import re
 import zlib
 import math
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _minimax_closure_loops(d):
+    """
+    Floyd-Warshall minimax closure (Subdominant Ultrametric), in place.
+    d(i,j) <- min(d(i,j), max(d(i,k), d(k,j))) for every pivot k.
+    """
+    n = d.shape[0]
+    for k in range(n):
+        for i in range(n):
+            dik = d[i, k]
+            for j in range(n):
+                # Triangle: d(i,j) <= max(d(i,k), d(k,j))
+                indirect = dik if dik > d[k, j] else d[k, j]
+                if indirect < d[i, j]:
+                    d[i, j] = indirect
+    return d
+
+
+def _minimax_closure_broadcast(d):
+    """
+    Same closure as _minimax_closure_loops, one broadcast update per pivot k.
+    Row/column k are fixed points of pivot k, so the update is safe in place.
+    """
+    for k in range(d.shape[0]):
+        np.minimum(d, np.maximum(d[:, k, None], d[None, k, :]), out=d)
+    return d
+
+
+if njit is not None:
+    _minimax_closure = njit(cache=True)(_minimax_closure_loops)
+else:
+    _minimax_closure = _minimax_closure_broadcast
+
+
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+
+def _compile_entity_scanner(entities):
+    """
+    Builds a single-pass multi-entity scanner.
+    Returns (pattern, contained) where pattern finds the longest entity
+    starting at every position (zero-width lookahead, so overlaps are kept)
+    and contained[e] lists the other entities that occur inside e.
+    """
+    ordered = sorted(set(entities), key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(e) for e in ordered) + "))")
+    contained = {e: [f for f in ordered if f != e and f in e] for e in ordered}
+    return pattern, contained
+
+
+# DEFLATE level 1: ~4x faster than the default level 6; NCD is a ratio,
+# so the small loss in compression ratio largely cancels out.
+NCD_COMPRESS_LEVEL = 1
+
+
+def _compressed_len(b):
+    """Compressed size of a byte string (not memoized: for one-off samples)."""
+    return len(zlib.compress(b, NCD_COMPRESS_LEVEL))
+
+# Below this many entities, process start-up costs more than the RANSAC work.
+PARALLEL_MIN_ENTITIES = 40
+
+# Per-process state for the RANSAC row pool (set once by the initializer,
+# so the encoded contexts are pickled once per worker, not once per row).
+_ROW_WORKER = {}
+
+
+def _init_row_worker(solver_args, encoded):
+    _ROW_WORKER['solver'] = TextRANSACSolver(*solver_args)
+    _ROW_WORKER['encoded'] = encoded
+
+
+def _ransac_row_task(i, seed):
+    return i, _ROW_WORKER['solver']._ransac_row(_ROW_WORKER['encoded'], i, seed)
+
 
 class TextRANSACSolver:
     """
@@ -10,10 +95,26 @@ class TextRANSACSolver:
     2. Lifting: Rectifies matrix to satisfy Strong Triangle Inequality.
     3. Audit: Checks p-adic convergence.
     """
-    def __init__(self, p=2, ransac_iterations=20, sample_ratio=0.5):
+    def __init__(self, p=2, ransac_iterations=20, sample_ratio=0.5, seed=None, workers=None):
         self.p = p
         self.iterations = ransac_iterations
         self.sample_ratio = sample_ratio
+        # RANSAC row pool size (None -> os.cpu_count(), 1 -> serial)
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        # RANSAC sub-sampling stream (pass a seed for reproducible runs)
+        self._rng = np.random.default_rng(seed)
+        # Compressed-size memo (bytes -> C(bytes)) for strings that recur:
+        # full entity contexts (K-complexity, small-context NCD) and single
+        # sentences. Bounded by the text; one-off samples never go in here.
+        self._k_cache = {}
+
+    def _clen(self, b):
+        """Compressed size of a recurring byte string (memoized, see _k_cache)."""
+        v = self._k_cache.get(b)
+        if v is None:
+            v = len(zlib.compress(b, NCD_COMPRESS_LEVEL))
+            self._k_cache[b] = v
+        return v
 
     def solve(self, raw_text, entities):
         """
@@ -25,17 +126,8 @@ class TextRANSACSolver:
         contexts = self._build_contexts(raw_text, entities)
         
         # 2. RANSAC Distance Discovery
-        n = len(entities)
-        matrix = [[0.0] * n for _ in range(n)]
-        
         print(f"   > RANSAC: Sampling {self.iterations} sub-contexts per pair...")
-        for i in range(n):
-            for j in range(i+1, n):
-                dist_inlier, consensus_score = self._ransac_distance(contexts[entities[i]], contexts[entities[j]])
-                matrix[i][j] = dist_inlier
-                matrix[j][i] = dist_inlier
-                # Optional: We could weight by consensus_score?
-                # For now, let's trust the robust distance.
+        matrix = self._distance_matrix(contexts, entities)
 
         # 3. Ultrametric Lifting (The Rectifier)
         print("   > Lifting: Enforcing Strong Triangle Inequality...")
@@ -46,7 +138,44 @@ class TextRANSACSolver:
         # The 'lifted_matrix' is now a valid ultrametric space.
         # We can pass this to the UltrametricBuilder.
         
-        return lifted_matrix, energy, self._build_directed_tree(lifted_matrix, entities, contexts)
+        directed_tree = self._build_directed_tree(lifted_matrix, entities, contexts)
+        return lifted_matrix.tolist(), energy, directed_tree
+
+    def _distance_matrix(self, contexts, entities):
+        """
+        All-pairs RANSAC distance matrix (symmetric, zero diagonal).
+        Contexts are UTF-8 encoded once per entity, not once per sample.
+        Rows are independent, so large problems are spread over a process
+        pool; each row has its own seed, so the result does not depend on
+        the worker count.
+        """
+        n = len(entities)
+        matrix = np.zeros((n, n), dtype=np.float64)
+        encoded = [[s.encode('utf-8') for s in contexts[e]] for e in entities]
+        seeds = self._rng.integers(0, 2**63 - 1, size=n).tolist()
+        
+        if self.workers > 1 and n >= PARALLEL_MIN_ENTITIES:
+            solver_args = (self.p, self.iterations, self.sample_ratio)
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_row_worker,
+                                     initargs=(solver_args, encoded)) as ex:
+                rows = list(ex.map(_ransac_row_task, range(n), seeds))
+        else:
+            rows = [(i, self._ransac_row(encoded, i, seeds[i])) for i in range(n)]
+        
+        for i, row in rows:
+            # Optional: We could weight by consensus_score?
+            # For now, let's trust the robust distance.
+            matrix[i, i+1:] = row
+            matrix[i+1:, i] = row
+        return matrix
+
+    def _ransac_row(self, encoded, i, seed):
+        """
+        RANSAC distances from entity i to every entity j > i.
+        """
+        rng = np.random.default_rng(seed)
+        return [self._ransac_distance(encoded[i], encoded[j], rng)[0]
+                for j in range(i+1, len(encoded))]
 
     def _build_directed_tree(self, matrix, labels, contexts):
         """
@@ -58,7 +187,7 @@ class TextRANSACSolver:
         k_scores = {}
         for l in labels:
             full_c = " ".join(contexts[l])
-            k_scores[l] = len(zlib.compress(full_c.encode('utf-8')))
+            k_scores[l] = self._clen(full_c.encode('utf-8'))
 
         # Normalize to v_p (1..10)
         if not k_scores: return "();"
@@ -83,21 +212,25 @@ class TextRANSACSolver:
         clusters = {i: f"{labels[i]}_{{v_p={get_vp(k_scores[labels[i]])}}}" for i in range(n)}
         cluster_k = {i: k_scores[labels[i]] for i in range(n)} 
 
-        active_ids = set(range(n))
-        dists = {}
-        for i in range(n):
-            for j in range(i+1, n):
-                dists[(i,j)] = matrix[i][j]
+        active = np.ones(n, dtype=bool)
+        n_active = n
+        # Working copy of the linkage distances (symmetric)
+        dists = np.array(matrix, dtype=np.float64)
+
+        # Min-heap of candidate merges. Entries go stale when a cluster is
+        # absorbed or its linkage grows; they are skipped lazily on pop.
+        # (d, i, j) ordering keeps the old tie-break (lowest pair first).
+        iu, ju = np.triu_indices(n, 1)
+        heap = list(zip(dists[iu, ju].tolist(), iu.tolist(), ju.tolist()))
+        heapq.heapify(heap)
 
-        while len(active_ids) > 1:
+        while n_active > 1:
             best_pair = None
-            min_d = float('inf')
-            
-            for (i,j), d in dists.items():
-                if i in active_ids and j in active_ids:
-                    if d < min_d:
-                        min_d = d
-                        best_pair = (i,j)
+            while heap:
+                d, i, j = heapq.heappop(heap)
+                if active[i] and active[j] and dists[i, j] == d:
+                    best_pair = (i,j)
+                    break
                         
             if best_pair is None: break
             
@@ -133,57 +266,83 @@ class TextRANSACSolver:
             
             clusters[i] = new_name
             cluster_k[i] = new_k
-            active_ids.remove(j)
+            active[j] = False
+            n_active -= 1
             
-            # Update Dists (Complete Linkage)
-            for k in list(active_ids):
+            # Update Dists (Complete Linkage): one row-max over all clusters
+            row = np.maximum(dists[i], dists[j])
+            dists[i, :] = row
+            dists[:, i] = row
+            row = row.tolist()
+            for k in np.flatnonzero(active).tolist():
                 if k == i: continue
-                di = dists.get(tuple(sorted((i,k))), float('inf'))
-                dj = dists.get(tuple(sorted((j,k))), float('inf'))
-                dists[tuple(sorted((i,k)))] = max(di, dj)
+                heapq.heappush(heap, (row[k], min(i, k), max(i, k)))
                 
-        return clusters[list(active_ids)[0]] + ";"
+        return clusters[int(np.flatnonzero(active)[0])] + ";"
 
     def _build_contexts(self, text, entities):
         """
         Extracts list of sentences for each entity.
         Includes Masking (__ENT__) by default.
         """
-        import re
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _SENT_SPLIT.split(text)
         contexts = {e: [] for e in entities}
+        if not entities: return contexts
         
+        # One regex pass per sentence instead of one `in` scan per entity
+        scanner, contained = _compile_entity_scanner(entities)
+        order = {e: i for i, e in reversed(list(enumerate(entities)))}
         for s in sentences:
-            for e in entities:
-                if e in s:
-                    masked = s.replace(e, "__ENT__")
-                    contexts[e].append(masked)
+            hits = set()
+            for m in scanner.finditer(s):
+                e = m.group(1)
+                if e not in hits:
+                    hits.add(e)
+                    hits.update(contained[e])
+            for e in sorted(hits, key=order.__getitem__):
+                masked = s.replace(e, "__ENT__")
+                contexts[e].append(masked)
         return contexts
 
-    def _ransac_distance(self, list_a, list_b):
+    def _ransac_distance(self, list_a, list_b, rng=None):
         """
-        Finds the robust 'Inlier' distance between two sentence sets.
+        Finds the robust 'Inlier' distance between two sentence sets
+        (lists of UTF-8 encoded sentences).
         Avoids outliers (e.g. 1 random sentence linking Platypus to Reptile).
         """
         if not list_a or not list_b: return 1.0, 0.0
+        rng = rng if rng is not None else self._rng
         
         distances = []
         
         # If contexts are small, just use full
         if len(list_a) < 3 or len(list_b) < 3:
-            return self._ncd(" ".join(list_a), " ".join(list_b)), 1.0
+            ba = b" ".join(list_a)
+            bb = b" ".join(list_b)
+            if not ba or not bb: return 1.0, 1.0
+            return self._ncd_bytes(ba, bb, self._clen(ba), self._clen(bb)), 1.0
             
+        # Sample Subsets
+        # Ensure we take at least 1, but up to ratio
+        n_a, n_b = len(list_a), len(list_b)
+        k_a = max(1, int(n_a * self.sample_ratio))
+        k_b = max(1, int(n_b * self.sample_ratio))
+        
+        # Only single-sentence samples (k = 1) recur across iterations;
+        # larger random joins are practically never repeated, so memoizing
+        # them would only retain every sample.
+        size_a = self._clen if k_a == 1 else _compressed_len
+        size_b = self._clen if k_b == 1 else _compressed_len
+        
         # RANSAC Loop
         for _ in range(self.iterations):
-            # Sample Subsets
-            # Ensure we take at least 1, but up to ratio
-            k_a = max(1, int(len(list_a) * self.sample_ratio))
-            k_b = max(1, int(len(list_b) * self.sample_ratio))
+            # Draw index subsets without replacement
+            sub_a = [list_a[i] for i in rng.choice(n_a, k_a, replace=False)]
+            sub_b = [list_b[i] for i in rng.choice(n_b, k_b, replace=False)]
             
-            sub_a = random.sample(list_a, k_a)
-            sub_b = random.sample(list_b, k_b)
-            
-            d = self._ncd(" ".join(sub_a), " ".join(sub_b))
+            ba = b" ".join(sub_a)
+            bb = b" ".join(sub_b)
+            d = self._ncd_bytes(ba, bb, size_a(ba), size_b(bb))
             distances.append(d)
             
         distances.sort()
@@ -204,9 +363,17 @@ class TextRANSACSolver:
         if not s1 or not s2: return 1.0
         b1 = s1.encode('utf-8')
         b2 = s2.encode('utf-8')
-        c1 = len(zlib.compress(b1))
-        c2 = len(zlib.compress(b2))
-        c12 = len(zlib.compress(b1 + b2))
+        return self._ncd_bytes(b1, b2, _compressed_len(b1), _compressed_len(b2))
+
+    def _ncd_bytes(self, b1, b2, c1, c2):
+        """
+        NCD with the single-string sizes supplied by the caller,
+        so only the joint compression C(b1 + b2) is new work.
+        b1 and b2 are streamed through one compressor instead of being
+        concatenated (joint samples are unique, so there is nothing to cache).
+        """
+        co = zlib.compressobj(NCD_COMPRESS_LEVEL)
+        c12 = len(co.compress(b1)) + len(co.compress(b2)) + len(co.flush())
         return max(0.0, min(1.0, (c12 - min(c1, c2)) / max(c1, c2)))
 
     def _lift_to_ultrametric(self, matrix):
@@ -220,9 +387,8 @@ class TextRANSACSolver:
         1. Transitive Closure (Subdominant Ultrametric).
         2. Quantization (Snap to 1/p^k).
         """
-        n = len(matrix)
         # Copy
-        d = [row[:] for row in matrix]
+        d = np.array(matrix, dtype=np.float64)
         
         # Floyd-Warshall adaptation for Ultrametric
         # Path capacity = min(edge weights). We want max capacity path?
@@ -230,40 +396,21 @@ class TextRANSACSolver:
         # The lowest "highest barrier" you must simplify.
         
         # 1. Minimax Path (Single Linkage equivalent)
-        for k in range(n):
-            for i in range(n):
-                for j in range(n):
-                    # Triangle: d(i,j) <= max(d(i,k), d(k,j))
-                    # We tighten d(i,j) if a "better path" exists
-                    indirect = max(d[i][k], d[k][j])
-                    if indirect < d[i][j]:
-                        d[i][j] = indirect
-                        
+        # Numba-compiled loops when available, NumPy broadcast otherwise.
+        _minimax_closure(d)
+
         # 2. P-adic Quantization (The "Snap")
         # Snap values to 1, 1/p, 1/p^2...
-        # log_p(d) -> integer levels
-        total_energy = 0.0
-        
-        for i in range(n):
-            for j in range(n):
-                val = d[i][j]
-                if val <= 0: continue
-                # target level k
-                # p^-k approx val
-                # -k log p = log val
-                # k = -log_p(val)
-                if val >= 1.0: 
-                    snapped = 1.0
-                else:
-                    k = -math.log(val, self.p)
-                    k_int = round(k)
-                    # Bias towards "higher" structure (lower k)? Or closer?
-                    # Let's just round.
-                    snapped = self.p ** (-k_int)
-                
-                # Check deviation
-                distinct_diff = abs(val - snapped)
-                total_energy += distinct_diff
-                d[i][j] = snapped
-                
-        return d, total_energy
+        # k = -log_p(d): one np.log over the matrix, divided by a scalar log(p)
+        log_p = math.log(self.p)
+        d_safe = np.where(d > 0, d, 1.0)
+        k_arr = np.round(-np.log(d_safe) / log_p)
+        snapped = np.power(float(self.p), -k_arr)
+        snapped = np.where(d >= 1.0, 1.0, snapped)
+        # Entries <= 0 are left untouched (zero deviation)
+        snapped = np.where(d <= 0, d, snapped)
+
+        # Deviation from the lattice is the lifting energy
+        total_energy = float(np.abs(d - snapped).sum())
+
+        return snapped, total_energy
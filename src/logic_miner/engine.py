@@ -239,7 +239,7 @@ class LogicMiner:
         2. Lift: Find logic rule F(x).
         """
         print("--- [Logic Miner] Stage 0: Pre-Flight Checks ---")
-        from .core.metrics import calculate_lipschitz_violation
+        from .core.metrics import calculate_lipschitz_violation, modular_fidelity, int64_or_none
         
         print("--- [Logic Miner] Stage 1: Discovery ---")
         p, score, candidates = self.selector.select_detailed(inputs, outputs)
@@ -258,6 +258,11 @@ class LogicMiner:
             if len(valid_candidates) >= 3:
                  subsets_to_try.append(valid_candidates[:3])
                  
+            # Observations as int64 once when they fit; the validator is
+            # vectorized for small moduli and exact otherwise
+            x_arr = int64_or_none(inputs)
+            y_arr = int64_or_none(outputs)
+            
             synth_res = None
             for subset in subsets_to_try:
                 res = integrator.solve_crt(subset, inputs, outputs)
@@ -266,15 +271,7 @@ class LogicMiner:
                      # Verify Fidelity on GLOBAL Integers
                      M = res['modulus']
                      params = res['params']
-                     hits = 0
-                     for x, y in zip(inputs, outputs):
-                         pred = 0
-                         if res['degree'] == 1: pred = (params[0]*x + params[1]) % M
-                         elif res['degree'] == 0: pred = params[0] % M
-                         
-                         if pred == y % M: hits += 1
-                         
-                     fid = hits / len(inputs)
+                     fid = modular_fidelity(inputs, outputs, params, res['degree'], M, x_arr, y_arr)
                      print(f"   > Hasse Composite Fidelity (Mod {M}): {fid:.2f}")
                      
                      if fid > 0.95:
@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.logic_miner.core.metrics import int64_or_none, modular_fidelity
+
+def exact_fidelity(inputs, outputs, params, degree, M):
+    """Reference tally in Python ints."""
+    hits = 0
+    for x, y in zip(inputs, outputs):
+        pred = 0
+        if degree == 1: pred = (params[0]*x + params[1]) % M
+        elif degree == 0: pred = params[0] % M
+        if pred == y % M: hits += 1
+    return hits / len(inputs)
+
+class TestModularFidelity(unittest.TestCase):
+    def test_int64_or_none_accepts_ints(self):
+        arr = int64_or_none([0, -5, 2**62])
+        self.assertIsNotNone(arr)
+        self.assertEqual(arr.tolist(), [0, -5, 2**62])
+
+    def test_int64_or_none_rejects_non_int(self):
+        # Floats must not be truncated into the int64 path
+        self.assertIsNone(int64_or_none([1, 2.5, 3]))
+        self.assertIsNone(int64_or_none([True, 1]))
+
+    def test_int64_or_none_rejects_overflow(self):
+        self.assertIsNone(int64_or_none([1, 2**63]))
+        self.assertIsNone(int64_or_none([-2**63 - 1]))
+
+    def test_large_composite_modulus(self):
+        # M^2 is far past int64: the vectorized product would wrap
+        M = 23**3 * 29**3 * 31**3
+        a, b = M // 3 + 7, 5
+        xs = list(range(10**12, 10**12 + 100))
+        ys = [(a*x + b) % M for x in xs]
+        fid = modular_fidelity(xs, ys, (a, b), 1, M, int64_or_none(xs), int64_or_none(ys))
+        self.assertEqual(fid, 1.0)
+
+    def test_small_modulus_matches_exact(self):
+        xs = list(range(-50, 150))
+        ys = [(3*x + 2) % 97 if x % 4 else x for x in xs]
+        xa, ya = int64_or_none(xs), int64_or_none(ys)
+        for params, degree in (((3, 2), 1), ((5,), 0), ((1, 1, 1), 2)):
+            self.assertEqual(modular_fidelity(xs, ys, params, degree, 97, xa, ya),
+                             exact_fidelity(xs, ys, params, degree, 97))
+
+    def test_non_int_inputs(self):
+        xs = [0.5, 1.0, 2.0, 3.0]
+        ys = [(2*x + 1) % 11 for x in xs]
+        fid = modular_fidelity(xs, ys, (2, 1), 1, 11, int64_or_none(xs), int64_or_none(ys))
+        self.assertEqual(fid, 1.0)
+
+    def test_inputs_beyond_int64(self):
+        xs = [2**63 + k for k in range(10)]
+        ys = [(7*x + 3) % 101 for x in xs]
+        self.assertIsNone(int64_or_none(xs))
+        fid = modular_fidelity(xs, ys, (7, 3), 1, 101, int64_or_none(xs), int64_or_none(ys))
+        self.assertEqual(fid, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
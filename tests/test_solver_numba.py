@@ -0,0 +1,65 @@
+import unittest
+import random
+import sys
+import os
+from unittest import mock
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.logic_miner.core import solver
+from src.logic_miner.core.solver_numba import _ransac_poly_loops, encode_points, poly_inlier_mask
+
+P = 101
+
+def make_points(coeffs, n=120, seed=5):
+    """
+    y = poly(x) mod P (coeffs highest degree first) for 3/4 of the points.
+    The rest are outliers: shifted off the curve, or y outside [0, P).
+    """
+    rng = random.Random(seed)
+    data, inliers = [], set()
+    for x in range(n):
+        y = 0
+        for c in coeffs:
+            y = (y * x + c) % P
+        r = rng.random()
+        if r < 0.2:
+            y = (y + rng.randint(1, P - 1)) % P
+        elif r < 0.25:
+            y += P
+        else:
+            inliers.add(x)
+        data.append((x, y))
+    return data, inliers
+
+class TestRansacPolyKernel(unittest.TestCase):
+    """The kernel run as plain Python, so it is covered without numba."""
+
+    def check_recovers(self, coeffs):
+        degree = len(coeffs) - 1
+        data, inliers = make_points(coeffs)
+        xr, ysr, yc = encode_points(data, P)
+        params, count = _ransac_poly_loops(xr, ysr, yc, P, 60, degree, 7)
+        self.assertEqual(params.tolist(), list(coeffs))
+        self.assertEqual(count, len(inliers))
+        mask = poly_inlier_mask(xr, yc, params.tolist(), P)
+        self.assertEqual(set(mask.nonzero()[0].tolist()), inliers)
+
+    def test_recovers_quadratic(self):
+        self.check_recovers((3, 17, 42))
+
+    def test_recovers_cubic(self):
+        self.check_recovers((5, 0, 88, 9))
+
+    def test_mask_matches_interpreted_inliers(self):
+        for coeffs in ((3, 17, 42), (5, 0, 88, 9)):
+            degree = len(coeffs) - 1
+            data, _ = make_points(coeffs, seed=11)
+            random.seed(3)
+            with mock.patch.object(solver, 'ransac_poly_kernel', None):
+                res = solver.ModularSolver(P)._ransac_poly(data, 60, degree)
+            self.assertEqual(tuple(res['model']), coeffs)
+            xr, _, yc = encode_points(data, P)
+            mask = poly_inlier_mask(xr, yc, res['model'], P)
+            self.assertEqual([data[i] for i in mask.nonzero()[0]], res['inliers'])
+
+if __name__ == '__main__':
+    unittest.main()